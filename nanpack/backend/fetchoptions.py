@@ -43,7 +43,7 @@ class FetchOptions:
         '''Print a list of options avaible for the LIMITERFUNC argument in
         the call to function SecondOrderTVD().
         '''
-        self.options = ["Harten-Yee-Upwind", "Modified-Harten-Yee-Upwind",\
-                        "Roe-Sweby-Upwind", "Davis-Yee-Symmetric"]
+        from nanpack.limiters import TVDLimiterOptions
+        self.options = list(TVDLimiterOptions)
         return self.options
     
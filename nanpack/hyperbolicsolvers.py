@@ -40,8 +40,109 @@
 +**************************************************************************
 +**************************************************************************
 '''
+from functools import wraps
+import numpy as np
+from numba import (cfunc, carray, get_num_threads, njit, prange, stencil,
+                   types)
+from nanpack import secondaryfunctions as sf
+from nanpack import tridiagonal as trid
+from nanpack import tvdfunctions as tvd
+from nanpack.limiters import TVDLimiterCodes
+
+#**************************************************************************
+def _CheckOutput(Uo, out, xp=np):
+    '''Raise an Exception if out overlaps Uo. The compiled kernels read
+    Uo while writing out, so the two arrays must be distinct; a time
+    loop alternates between two arrays instead.
+    '''
+    if xp.may_share_memory(out, Uo):
+        raise Exception("The out array must not share memory with Uo,\
+ alternate between two arrays in the time loop instead.")
+
+#**************************************************************************
+def _GetOutput(Uo, out):
+    '''Return the array in which a solver stores the solution at time
+    level (n+1), initialized with Uo.
+    '''
+    if out is None:
+        return Uo.copy()
+    _CheckOutput(Uo, out)
+    np.copyto(out, Uo)
+    return out
+
+#**************************************************************************
+def _GetOutputEnds(Uo, out, nEnd, xp=np):
+    '''Return the array in which a solver stores the solution at time
+    level (n+1), with only the nEnd points at either end taken from Uo.
+    For solvers which overwrite all the other points. xp is the array
+    module of Uo.
+    '''
+    if out is None:
+        U = xp.empty_like(Uo)
+    else:
+        _CheckOutput(Uo, out, xp)
+        U = out
+    U[:nEnd] = Uo[:nEnd]
+    U[-nEnd:] = Uo[-nEnd:]
+    return U
+
+#**************************************************************************
+def _Validate1D(disallow):
+    '''Decorator for the solvers f(cfg, Uo, ...) which are available for
+    1D problems only, and not for the models in disallow. The model is
+    taken from cfg._model_key, uppercased once when cfg is created.
+    '''
+    def decorate(solver):
+        @wraps(solver)
+        def wrapper(cfg, Uo, *args, **kwargs):
+            if __debug__ and Uo.ndim != 1:
+                raise ValueError("This formulation is only available for\
+ 1D problems in this version.")
+            if cfg._model_key in disallow:
+                raise Exception(f"This formulation is not available for\
+ {cfg.Model} equation in this version.")
+            return solver(cfg, Uo, *args, **kwargs)
+        return wrapper
+    return decorate
+
+#**************************************************************************
+def _GetScratch(cfg, name, shape, dtype):
+    '''Return the work array "name" stored on cfg. The array is
+    allocated on the first request or when the shape or dtype changes,
+    and is reused by the following time steps otherwise.
+    '''
+    A = cfg._scratch.get(name)
+    if A is None or A.shape != shape or A.dtype != dtype:
+        A = np.empty(shape, dtype)
+        cfg._scratch[name] = A
+    return A
+
+#**************************************************************************
+def _GetE(cfg, Uo):
+    '''Return E = u^2/2 of the Burgers equation. E is formed in a work
+    array stored on cfg, hence it is only valid until the next call.
+    '''
+    E = _GetScratch(cfg, 'E', Uo.shape, Uo.dtype)
+    np.multiply(Uo, Uo, out=E)
+    E *= 0.5
+    return E
+
+#**************************************************************************
+def _GetA(cfg, Uo):
+    '''Return A = dE/du of the Burgers equation at (i+1/2) in a work
+    array stored on cfg, A = u at the end points. For E = u^2/2,
+    (E(i+1)-E(i))/(u(i+1)-u(i)) reduces to (u(i+1)+u(i))/2, which also
+    holds where u(i+1) = u(i).
+    '''
+    A = _GetScratch(cfg, 'A', Uo.shape, Uo.dtype)
+    A[0] = Uo[0]
+    A[-1] = Uo[-1]
+    np.add(Uo[2:], Uo[1:-1], out=A[1:-1])
+    A[1:-1] *= 0.5
+    return A
+
 #**************************************************************************
-def ExplicitFirstUpwind(cfg, Uo, Courant):
+def ExplicitFirstUpwind(cfg, Uo, Courant, out=None):
     '''Solve a first-order 1D wave equation or inviscid Burgers equation
     using the explicit first upwind differencing method.
 
@@ -65,7 +166,7 @@ def ExplicitFirstUpwind(cfg, Uo, Courant):
                 
     Call signature:
 
-        FirstOrderUpwind(cfg, Uo, Courant)
+        FirstOrderUpwind(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -83,6 +184,12 @@ def ExplicitFirstUpwind(cfg, Uo, Courant):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -91,28 +198,65 @@ def ExplicitFirstUpwind(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    import numpy as np
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        positive_a = 1 + np.sign(cfg.conv) # for positive a
-        negative_a = 1 - np.sign(cfg.conv) # for negative a
-        U[1:-1] = Uo[1:-1]\
-                  - 0.5*Courant*positive_a*(Uo[1:-1]-Uo[0:-2])\
-                  - 0.5*Courant*negative_a*(Uo[2:]-Uo[1:-1])
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutput(Uo, out)
+    SolverFunc = _SelectSolver(cfg, 'ExplicitFirstUpwind')
+    return SolverFunc(cfg, Uo, Courant, U)
+
+#**************************************************************************
+def _EFUWave(cfg, Uo, Courant, U):
+    '''ExplicitFirstUpwind() for the first-order wave equation.'''
+    # The sign of a is constant over the grid, so the upwind direction
+    # is selected once and only that one-sided difference is evaluated.
+    _EFUWaveKernel(Uo, Courant, cfg._sign_conv > 0, U)
+
+    return U
 
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        E = Uo*Uo/2
-        U[1:-1] = Uo[1:-1] - Courant*(E[1:-1]-E[0:-2])
+#**************************************************************************
+def _EFUBurgers(cfg, Uo, Courant, U):
+    '''ExplicitFirstUpwind() for the inviscid Burgers equation.'''
+    _EFUBurgersKernel(Uo, Courant, U)
 
     return U
 
 #**************************************************************************
-def Lax(cfg, Uo, Courant):
+@njit(parallel=True, fastmath=True, cache=True)
+def _EFUWaveKernel(Uo, Courant, positive_a, U):
+    '''Explicit first upwind update of the first-order wave equation.
+    The backward difference is used for positive a and the forward
+    difference for negative a.
+    '''
+    n = Uo.shape[0]
+    if positive_a:
+        for i in prange(1, n-1):
+            U[i] = Uo[i] - Courant*(Uo[i] - Uo[i-1])
+    else:
+        for i in prange(1, n-1):
+            U[i] = Uo[i] - Courant*(Uo[i+1] - Uo[i])
+
+#**************************************************************************
+@njit(parallel=True, fastmath=True, cache=True)
+def _EFUBurgersKernel(Uo, Courant, U):
+    '''Explicit first upwind update of the inviscid Burgers equation.
+    The wave speed u changes sign over the grid, hence the upwind
+    direction is selected at every point.
+    '''
+    n = Uo.shape[0]
+    for i in prange(1, n-1):
+        um = Uo[i-1]
+        u0 = Uo[i]
+        up = Uo[i+1]
+        if u0 > 0.0:
+            U[i] = u0 - Courant*0.5*(u0*u0 - um*um)
+        else:
+            U[i] = u0 - Courant*0.5*(up*up - u0*u0)
+
+#**************************************************************************
+def Lax(cfg, Uo, Courant, out=None):
     '''Solve a first-order 1D wave equation or inviscid Burgers equation
     using the explicit Lax method.
        
@@ -136,7 +280,7 @@ def Lax(cfg, Uo, Courant):
                 
     Call signature:
 
-        Lax(cfg, Uo, Courant)
+        Lax(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -154,6 +298,12 @@ def Lax(cfg, Uo, Courant):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -162,23 +312,49 @@ def Lax(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        U[1:-1] = 0.5*(Uo[2:]+Uo[0:-2])\
-                  - 0.5*Courant*(Uo[2:]-Uo[0:-2])
-    
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        E = Uo*Uo/2
-        U[1:-1] = 0.5*(Uo[2:]+Uo[0:-2])\
-                  - 0.25*Courant*(E[2:]-E[0:-2])
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutput(Uo, out)
+    SolverFunc = _SelectSolver(cfg, 'Lax')
+    return SolverFunc(cfg, Uo, Courant, U)
+
+#**************************************************************************
+def _LaxWave(cfg, Uo, Courant, U):
+    '''Lax() for the first-order wave equation.'''
+    _LaxWaveKernel(Uo, Courant, U)
+
+    return U
+
+#**************************************************************************
+def _LaxBurgers(cfg, Uo, Courant, U):
+    '''Lax() for the inviscid Burgers equation.'''
+    _LaxBurgersKernel(Uo, Courant, U)
 
     return U
 
+#**************************************************************************
+@njit(parallel=True, fastmath=True, cache=True)
+def _LaxWaveKernel(Uo, Courant, U):
+    '''Lax update of the first-order wave equation.'''
+    n = Uo.shape[0]
+    for i in prange(1, n-1):
+        um = Uo[i-1]
+        up = Uo[i+1]
+        U[i] = 0.5*(up + um) - 0.5*Courant*(up - um)
+
+#**************************************************************************
+@njit(parallel=True, fastmath=True, cache=True)
+def _LaxBurgersKernel(Uo, Courant, U):
+    '''Lax update of the inviscid Burgers equation.'''
+    n = Uo.shape[0]
+    for i in prange(1, n-1):
+        um = Uo[i-1]
+        up = Uo[i+1]
+        U[i] = 0.5*(up + um) - 0.25*Courant*0.5*(up*up - um*um)
+
 #**************************************************************************
 def MidpointLeapfrog(cfg, Uo, Courant):
     '''Solve a first-order 1D wave equation or inviscid Burgers equation
@@ -230,24 +406,17 @@ def MidpointLeapfrog(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
-    
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for BURGERS\
- equation in this version.")
-        
-    #return U
+    # No model has this formulation yet, hence an exception is raised
+    # for every model.
+    SolverFunc = _SelectSolver(cfg, 'MidpointLeapfrog')
+    return SolverFunc(cfg, Uo, Courant)
 
 #**************************************************************************
-def LaxWendroff(cfg, Uo, Courant):
+def LaxWendroff(cfg, Uo, Courant, out=None):
     '''Solve a first-order 1D wave equation or inviscid Burgers equation
     using the explicit Lax-Wendroff method.
 
@@ -271,7 +440,7 @@ def LaxWendroff(cfg, Uo, Courant):
                 
     Call signature:
 
-        LaxWendroff(cfg, Uo, Courant)
+        LaxWendroff(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -289,6 +458,12 @@ def LaxWendroff(cfg, Uo, Courant):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -297,28 +472,60 @@ def LaxWendroff(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        Courant2 = Courant*Courant
-        U[1:-1] = Uo[1:-1] - 0.5*Courant*(Uo[2:]-Uo[0:-2])\
-                  + 0.5*Courant2*(Uo[2:] - 2.0*Uo[1:-1] + Uo[0:-2])
-    
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        E = Uo*Uo/2
-        Courant2 = Courant*Courant
-        U[1:-1] = Uo[1:-1] - 0.5*Courant*(E[2:]-E[0:-2])\
-                  + 0.25*Courant2*((Uo[2:]+Uo[1:-1])*(E[2:]-E[1:-1])\
-                                   - (Uo[1:-1]+Uo[0:-2])*(E[1:-1]-E[0:-2]))
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutput(Uo, out)
+    SolverFunc = _SelectSolver(cfg, 'LaxWendroff')
+    return SolverFunc(cfg, Uo, Courant, U)
+
+#**************************************************************************
+def _LaxWendroffWave(cfg, Uo, Courant, U):
+    '''LaxWendroff() for the first-order wave equation.'''
+    _LaxWendroffWaveKernel(Uo, Courant, U)
+
+    return U
+
+#**************************************************************************
+def _LaxWendroffBurgers(cfg, Uo, Courant, U):
+    '''LaxWendroff() for the inviscid Burgers equation.'''
+    _LaxWendroffBurgersKernel(Uo, Courant, U)
 
     return U
 
 #**************************************************************************
-def LaxWendroffMultiStep(cfg, Uo, Courant):
+@njit(parallel=True, fastmath=True, cache=True)
+def _LaxWendroffWaveKernel(Uo, Courant, U):
+    '''Lax-Wendroff update of the first-order wave equation.'''
+    n = Uo.shape[0]
+    Courant2 = Courant*Courant
+    for i in prange(1, n-1):
+        um = Uo[i-1]
+        u0 = Uo[i]
+        up = Uo[i+1]
+        U[i] = u0 - 0.5*Courant*(up - um)\
+               + 0.5*Courant2*(up - 2.0*u0 + um)
+
+#**************************************************************************
+@njit(parallel=True, fastmath=True, cache=True)
+def _LaxWendroffBurgersKernel(Uo, Courant, U):
+    '''Lax-Wendroff update of the inviscid Burgers equation.'''
+    n = Uo.shape[0]
+    Courant2 = Courant*Courant
+    for i in prange(1, n-1):
+        um = Uo[i-1]
+        u0 = Uo[i]
+        up = Uo[i+1]
+        Em = 0.5*um*um
+        E0 = 0.5*u0*u0
+        Ep = 0.5*up*up
+        U[i] = u0 - 0.5*Courant*(Ep - Em)\
+               + 0.25*Courant2*((up + u0)*(Ep - E0) - (u0 + um)*(E0 - Em))
+
+#**************************************************************************
+def LaxWendroffMultiStep(cfg, Uo, Courant, out=None):
     '''Solve a first-order 1D wave equation using the explicit multi-step
     Lax-Wendroff method.
   
@@ -333,7 +540,7 @@ def LaxWendroffMultiStep(cfg, Uo, Courant):
                 
     Call signature:
 
-        LaxWendroffMultiStep(cfg, Uo, Courant)
+        LaxWendroffMultiStep(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -351,6 +558,12 @@ def LaxWendroffMultiStep(cfg, Uo, Courant):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -359,26 +572,51 @@ def LaxWendroffMultiStep(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    Uhalf = Uo.copy()
-    if cfg.Model.upper() == 'FO_WAVE':
-        for i in range(1,cfg.iMax-1):
-            Uhalf[i] = 0.5*(Uo[i+1]+Uo[i]) - 0.5*Courant*(Uo[i+1]-Uo[i])
-            U[i] = Uo[i] - Courant*(Uhalf[i]-Uhalf[i-1])
-    
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for BURGERS\
- equation in this version.")
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutput(Uo, out)
+    SolverFunc = _SelectSolver(cfg, 'LaxWendroffMultiStep')
+    return SolverFunc(cfg, Uo, Courant, U)
+
+#**************************************************************************
+def _LaxWendroffMultiStepWave(cfg, Uo, Courant, U):
+    '''LaxWendroffMultiStep() for the first-order wave equation.'''
+    Uhalf = _GetScratch(cfg, 'Uhalf', Uo.shape, Uo.dtype)
+    # Only the left boundary of Uhalf is read by the second step.
+    Uhalf[0] = Uo[0]
+    Uhalf[1:-1] = 0.5*(Uo[2:]+Uo[1:-1])\
+                  - 0.5*Courant*(Uo[2:]-Uo[1:-1])
+    U[1:-1] = Uo[1:-1] - Courant*(Uhalf[1:-1]-Uhalf[0:-2])
 
     return U
 
 #**************************************************************************
-def MacCormack(cfg, Uo, Courant, diffX=None):
+@njit(parallel=True, fastmath=True, cache=True)
+def _MacCormackVisc(Uo, Courant, diffX, U, Utemp):
+    '''Predictor and corrector steps of the MacCormack method for the
+    viscous Burgers equation. The predicted solution is stored in Utemp
+    and E = u^2/2 is evaluated on the fly.
+    '''
+    n = Uo.shape[0]
+    Utemp[0] = Uo[0]
+    Utemp[n-1] = Uo[n-1]
+    # Predictor step
+    for i in prange(1, n-1):
+        dUo = - Courant*0.5*(Uo[i+1]*Uo[i+1] - Uo[i]*Uo[i])\
+              + diffX*(Uo[i+1] - 2.0*Uo[i] + Uo[i-1])
+        Utemp[i] = Uo[i] + dUo
+    # Corrector step
+    for i in prange(1, n-1):
+        dUtemp = - Courant*0.5*(Utemp[i]*Utemp[i]\
+                                - Utemp[i-1]*Utemp[i-1])\
+                 + diffX*(Utemp[i+1] - 2.0*Utemp[i] + Utemp[i-1])
+        U[i] = 0.5*(Uo[i] + Utemp[i] + dUtemp)
+
+#**************************************************************************
+def MacCormack(cfg, Uo, Courant, diffX=None, out=None):
     '''Solve a 1D wave equation or inviscid/viscous Burgers equation
     using the explicit MacCormack method.
    
@@ -416,7 +654,7 @@ def MacCormack(cfg, Uo, Courant, diffX=None):
 
     Call signature:
 
-        MacCormack(cfg, Uo, Courant, diffX)
+        MacCormack(cfg, Uo, Courant, diffX, out)
 
     Parameters
     ----------
@@ -434,6 +672,16 @@ def MacCormack(cfg, Uo, Courant, diffX=None):
 
               Courant number (entered as user input in file).
 
+    diffX : float, optional
+
+            Diffusion number, required for the viscous Burgers equation.
+
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -442,44 +690,131 @@ def MacCormack(cfg, Uo, Courant, diffX=None):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    iMax = shapeU
-    U = Uo.copy() # Initialize U
-    Utemp = Uo.copy()
-    if cfg.Model.upper() == 'FO_WAVE':
-        for i in range(1,iMax-1):
-            Utemp[i] = Uo[i] - Courant*(Uo[i+1]-Uo[i]) # Predictor step
-            U[i] = 0.5*((Uo[i]+Utemp[i])\
-                        - Courant*(Utemp[i]-Utemp[i-1])) # Corrector step
-
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        E = Uo*Uo/2
-        Etemp=Utemp*Utemp/2
-        for i in range(1,iMax-1):
-            Utemp[i] = Uo[i] - Courant*(E[i+1]-E[i]) # Predictor step
-            Etemp[i] = Utemp[i]*Utemp[i]/2
-            U[i] = 0.5*((Uo[i]+Utemp[i])\
-                        - Courant*(Etemp[i]-Etemp[i-1])) # Corrector step
-
-    elif cfg.Model.upper() == 'VISC_BURGERS':
-        E = Uo*Uo/2
-        c = A*Courant
-        for i in range(1,iMax-1):
-            dUo[i] = - Courant*(E[i+1]-E[i])\
-                     + diffX*(Uo[i+1] - 2.0*Uo[i] + Uo[i-1])
-            Utemp[i] = Uo[i] + dUo[i] # Predictor step
-            dUtemp[i] = - Courant*(Etemp[i]-Etemp[i-1])\
-                        + diffX*(Utemp[i+1] - 2.0*Utemp[i] + Utemp[i-1])
-            U[i] = 0.5 * (Uo[i]+Utemp[i]+dUtemp[i]) # Corrector step
+    if cfg._model_key == 'VISC_BURGERS' and diffX is None:
+        raise Exception("The diffusion number diffX is required for the\
+ viscous Burgers equation.")
+
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutput(Uo, out)
+    SolverFunc = _SelectSolver(cfg, 'MacCormack')
+    return SolverFunc(cfg, Uo, Courant, diffX, U)
+
+#**************************************************************************
+def _MacCormackWave(cfg, Uo, Courant, diffX, U):
+    '''MacCormack() for the first-order wave equation.'''
+    Utemp = _GetScratch(cfg, 'Utemp', Uo.shape, Uo.dtype)
+    # Only the left boundary of Utemp is read by the corrector step.
+    Utemp[0] = Uo[0]
+    # Predictor step
+    Utemp[1:-1] = Uo[1:-1] - Courant*(Uo[2:]-Uo[1:-1])
+    # Corrector step
+    U[1:-1] = 0.5*((Uo[1:-1]+Utemp[1:-1])\
+                   - Courant*(Utemp[1:-1]-Utemp[0:-2]))
+
+    return U
+
+#**************************************************************************
+def _MacCormackInvBurgers(cfg, Uo, Courant, diffX, U):
+    '''MacCormack() for the inviscid Burgers equation.'''
+    Utemp = _GetScratch(cfg, 'Utemp', Uo.shape, Uo.dtype)
+    # The viscous kernel without the viscous terms, E = u^2/2 of the
+    # predicted and the old solution is formed on the fly.
+    _MacCormackVisc(Uo, Courant, 0.0, U, Utemp)
+
+    return U
+
+#**************************************************************************
+def _MacCormackViscBurgers(cfg, Uo, Courant, diffX, U):
+    '''MacCormack() for the viscous Burgers equation.'''
+    Utemp = _GetScratch(cfg, 'Utemp', Uo.shape, Uo.dtype)
+    _MacCormackVisc(Uo, Courant, diffX, U, Utemp)
 
     return U
 
 #**************************************************************************
-def FourthOrderRungeKutta(cfg, Uo, Courant):
+# Number of grid points advanced together through the four Runge-Kutta
+# stages. The three stage arrays of a tile (about 24 KB) fit in the L1
+# cache.
+_RK4_TILE = 1024
+
+@njit(inline='always')
+def _WaveFlux(u):
+    '''Flux of the first-order wave equation, E = u.'''
+    return u
+
+@njit(inline='always')
+def _BurgersFlux(u):
+    '''Flux of the inviscid Burgers equation, E = u^2/2.'''
+    return 0.5*u*u
+
+def _MakeRK4Kernel(flux):
+    '''Return a compiled four-stage Runge-Kutta kernel for the given
+    flux function.
+
+    The grid is split into tiles which are processed in parallel. All
+    four stages of a tile are computed before moving to the next tile,
+    so the stage values are read from cache rather than main memory.
+    Stage s needs the previous stage at one more point on either side,
+    hence the tile is extended by a halo of 4-s points for stage s.
+    '''
+    # Not cached on disk, the kernels made by this factory and by
+    # _MakeMRKKernel() share one qualified name per factory and would
+    # overwrite each other in the cache.
+    @njit(parallel=True, fastmath=True)
+    def kernel(Uo, Courant, U):
+        n = Uo.shape[0]
+        c2 = 0.25*Courant
+        c4 = 0.5*Courant
+        nTiles = (n - 2 + _RK4_TILE - 1)//_RK4_TILE
+        for t in prange(nTiles):
+            lo = 1 + t*_RK4_TILE
+            hi = min(lo + _RK4_TILE, n - 1)
+            off = lo - 4 # global index of the first local point
+            m = hi - lo + 8
+            U1 = np.empty(m, Uo.dtype)
+            U2 = np.empty(m, Uo.dtype)
+            U3 = np.empty(m, Uo.dtype)
+            # 1st stage
+            for j in range(max(lo - 3, 0), min(hi + 3, n)):
+                if j == 0 or j == n - 1:
+                    U1[j-off] = Uo[j]
+                else:
+                    U1[j-off] = Uo[j] - c2*(flux(Uo[j+1])\
+                                            - flux(Uo[j-1]))
+            # 2nd stage
+            for j in range(max(lo - 2, 0), min(hi + 2, n)):
+                k = j - off
+                if j == 0 or j == n - 1:
+                    U2[k] = Uo[j]
+                else:
+                    U2[k] = Uo[j] - c2*(flux(U1[k+1]) - flux(U1[k-1]))
+            # 3rd stage
+            for j in range(max(lo - 1, 0), min(hi + 1, n)):
+                k = j - off
+                if j == 0 or j == n - 1:
+                    U3[k] = Uo[j]
+                else:
+                    U3[k] = Uo[j] - c4*(flux(U2[k+1]) - flux(U2[k-1]))
+            # 4th stage
+            for j in range(lo, hi):
+                k = j - off
+                U[j] = Uo[j]\
+                       - c4*((1.0/6)*(flux(Uo[j+1]) - flux(Uo[j-1]))\
+                             + (1.0/3)*(flux(U1[k+1]) - flux(U1[k-1]))\
+                             + (1.0/3)*(flux(U2[k+1]) - flux(U2[k-1]))\
+                             + (1.0/6)*(flux(U3[k+1]) - flux(U3[k-1])))
+
+    return kernel
+
+_RK4WaveKernel = _MakeRK4Kernel(_WaveFlux)
+_RK4BurgersKernel = _MakeRK4Kernel(_BurgersFlux)
+
+#**************************************************************************
+def FourthOrderRungeKutta(cfg, Uo, Courant, out=None):
     '''Solve a first-order 1D wave equation or inviscid Burgers equation
     using the explicit four-stage Runge-Kutta method.
 
@@ -503,7 +838,7 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
                 
     Call signature:
 
-        FourthOrderRungeKutta(cfg, Uo, Courant)
+        FourthOrderRungeKutta(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -521,6 +856,12 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -529,56 +870,72 @@ def FourthOrderRungeKutta(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy()# Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        U1 = Uo.copy()
-        U2 = Uo.copy()
-        U3 = Uo.copy()
-        # 1st stage
-        U1[1:-1] = Uo[1:-1] - 0.5*Courant*(Uo[2:]-Uo[0:-2])/2.0
-        # 2nd stage
-        U2[1:-1] = Uo[1:-1] - 0.5*Courant*(U1[2:]-U1[0:-2])/2.0
-        # 3rd stage
-        U3[1:-1] = Uo[1:-1] - Courant*(U2[2:]-U2[0:-2])/2.0
-        # 4th stage
-        U[1:-1] = Uo[1:-1]\
-                  - 0.5*Courant\
-                  * (((1.0/6)*(Uo[2:] - Uo[0:-2]))\
-                     + ((1.0/3)*(U1[2:] - U1[0:-2]))\
-                     + ((1.0/3)*(U2[2:] - U2[0:-2]))\
-                     + ((1.0/6)*(U3[2:] - U3[0:-2])))
-
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        # 1st stage
-        U1 = Uo.copy()
-        U2 = Uo.copy()
-        U3 = Uo.copy()
-        E1 = Uo*Uo/2
-        U1[1:-1] = Uo[1:-1] - 0.5*Courant*(E1[2:]-E1[0:-2])/2.0
-        # 2nd stage
-        E2 = U1*U1/2
-        U2[1:-1] = Uo[1:-1] - 0.5*Courant*(E2[2:]-E2[0:-2])/2.0
-        # 3rd stage
-        E3 = U2*U2/2
-        U3[1:-1] = Uo[1:-1] - Courant*(E3[2:]-E3[0:-2])/2.0
-        # 4th stage
-        E4 = U3*U3/2
-        U[1:-1] = Uo[1:-1]\
-                  - 0.5*Courant\
-                  * (((1.0/6)*(E1[2:] - E1[0:-2]))\
-                     + ((1.0/3)*(E2[2:] - E2[0:-2]))\
-                     + ((1.0/3)*(E3[2:] - E3[0:-2]))\
-                     + ((1.0/6)*(E4[2:] - E4[0:-2])))
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutput(Uo, out)
+    SolverFunc = _SelectSolver(cfg, 'FourthOrderRungeKutta')
+    return SolverFunc(cfg, Uo, Courant, U)
+
+#**************************************************************************
+def _RK4Wave(cfg, Uo, Courant, U):
+    '''FourthOrderRungeKutta() for the first-order wave equation.'''
+    _RK4WaveKernel(Uo, Courant, U)
+
+    return U
+
+#**************************************************************************
+def _RK4Burgers(cfg, Uo, Courant, U):
+    '''FourthOrderRungeKutta() for the inviscid Burgers equation.'''
+    _RK4BurgersKernel(Uo, Courant, U)
 
     return U
 
 #**************************************************************************
-def ModifiedRungeKutta(cfg, Uo, Courant, diffX):
+def _MakeMRKKernel(flux):
+    '''Return a compiled four-stage Modified Runge-Kutta kernel for the
+    given flux function.
+
+    Each stage reads the previous stage and writes a separate array, the
+    stages alternating between U and Ustage. For the viscous Burgers
+    equation the viscous terms are added after the final stage, (pg 291.
+    CFD Vol 1 Hoffmann), within the same kernel.
+    '''
+    @njit(parallel=True, fastmath=True)
+    def kernel(Uo, Courant, diffX, viscous, U, Ustage):
+        n = Uo.shape[0]
+        Ustage[0] = Uo[0]
+        Ustage[n-1] = Uo[n-1]
+        # The stages are ordered such that the final result lands in U.
+        Uprev = Uo
+        if viscous:
+            Unew = U
+            Unext = Ustage
+        else:
+            Unew = Ustage
+            Unext = U
+        for div in (8.0, 6.0, 4.0, 2.0):
+            for i in prange(1, n-1):
+                Unew[i] = Uo[i] - Courant*(flux(Uprev[i+1])\
+                                           - flux(Uprev[i-1]))/div
+            # -- update BC here (required when Neumann BC is used)
+            Uprev = Unew
+            Unew = Unext
+            Unext = Uprev
+        if viscous:
+            for i in prange(1, n-1):
+                U[i] = Ustage[i] + diffX*(Ustage[i+1] - 2.0*Ustage[i]\
+                                          + Ustage[i-1])
+
+    return kernel
+
+_MRKWaveKernel = _MakeMRKKernel(_WaveFlux)
+_MRKBurgersKernel = _MakeMRKKernel(_BurgersFlux)
+
+#**************************************************************************
+def ModifiedRungeKutta(cfg, Uo, Courant, diffX, out=None):
     '''Solve a first-order 1D wave equation or inviscid Burgers equation
     using the explicit four-stage Modified Runge-Kutta method.
 
@@ -602,7 +959,7 @@ def ModifiedRungeKutta(cfg, Uo, Courant, diffX):
                 
     Call signature:
 
-        ModifiedRungeKutta(cfg, Uo, Courant, diffX)
+        ModifiedRungeKutta(cfg, Uo, Courant, diffX, out)
 
     Parameters
     ----------
@@ -620,6 +977,12 @@ def ModifiedRungeKutta(cfg, Uo, Courant, diffX):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -628,48 +991,36 @@ def ModifiedRungeKutta(cfg, Uo, Courant, diffX):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        # 1st stage
-        U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/8.0
-        # -- update BC here (required when Neumann BC is used)
-        # 2nd stage
-        U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/6.0
-        # -- update BC here (required when Neumann BC is used)
-        # 3rd stage
-        U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/4.0
-        # -- update BC here (required when Neumann BC is used)
-        # 4th stage
-        U[1:-1] = Uo[1:-1] - Courant*(U[2:]-U[0:-2])/2.0
-        # -- update BC here (required when Neumann BC is used)
-    
-    elif cfg.Model.upper() in ['INV_BURGERS', 'VISC_BURGERS']:
-        # 1st stage
-        E = Uo*Uo/2
-        U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/8.0
-        # -- update BC here (required when Neumann BC is used)
-        # 2nd stage
-        E = U*U/2
-        U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/6.0
-        # -- update BC here (required when Neumann BC is used)
-        # 3rd stage
-        E = U*U/2
-        U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/4.0
-        # -- update BC here (required when Neumann BC is used)
-        # 4th stage
-        E = U*U/2
-        U[1:-1] = Uo[1:-1] - Courant*(E[2:]-E[0:-2])/2.0
-        # -- update BC here (required when Neumann BC is used)
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutput(Uo, out)
+    SolverFunc = _SelectSolver(cfg, 'ModifiedRungeKutta')
+    return SolverFunc(cfg, Uo, Courant, diffX, U)
+
+#**************************************************************************
+def _MRKWave(cfg, Uo, Courant, diffX, U):
+    '''ModifiedRungeKutta() for the first-order wave equation.'''
+    Ustage = _GetScratch(cfg, 'Ustage', Uo.shape, Uo.dtype)
+    _MRKWaveKernel(Uo, Courant, 0.0, False, U, Ustage)
+
+    return U
+
+#**************************************************************************
+def _MRKBurgers(cfg, Uo, Courant, diffX, U):
+    '''ModifiedRungeKutta() for the inviscid Burgers equation.'''
+    Ustage = _GetScratch(cfg, 'Ustage', Uo.shape, Uo.dtype)
+    _MRKBurgersKernel(Uo, Courant, 0.0, False, U, Ustage)
 
-        if cfg.Model.upper() == 'VISC_BURGERS':
-            # Add the viscous terms in the viscous Burgers equation
-            # after the final stage, (pg 291. CFD Vol 1 Hoffmann]. 
-            U[1:-1] = U[1:-1] + diffX*(U[2:] - 2.0*U[1:-1] + U[0:-2])
+    return U
+
+#**************************************************************************
+def _MRKViscBurgers(cfg, Uo, Courant, diffX, U):
+    '''ModifiedRungeKutta() for the viscous Burgers equation.'''
+    Ustage = _GetScratch(cfg, 'Ustage', Uo.shape, Uo.dtype)
+    _MRKBurgersKernel(Uo, Courant, diffX, True, U, Ustage)
 
     return U
 
@@ -730,41 +1081,41 @@ def EulersBTCS(cfg, Uo, Courant, diffX=None):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    import nanpack.tridiagonal as trid
-
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    iMax = shapeU
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        cc = 0.5*Courant
-        A = [cc for i in range(iMax)]
-        B = [-1 for i in range(iMax)]
-        C = [-cc for i in range(iMax)]
-        D = -Uo
-        UU = Uo.copy()
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    SolverFunc = _SelectSolver(cfg, 'EulersBTCS')
+    return SolverFunc(cfg, Uo, Courant, diffX)
 
-        U = trid.TridiagonalSolver(cfg.iMax,A, B, C, D, UU)
+#**************************************************************************
+def _EulersBTCSWave(cfg, Uo, Courant, diffX):
+    '''EulersBTCS() for the first-order wave equation.'''
+    iMax = Uo.shape[0]
+    cc = 0.5*Courant
+    A = np.full(iMax, cc, Uo.dtype)
+    B = np.full(iMax, -1.0, Uo.dtype)
+    C = np.full(iMax, -cc, Uo.dtype)
+    D = -Uo
+    UU = Uo.copy()
 
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for BURGERS\
- equation in this version.")
+    U = trid.LapackTridiagonalSolver(iMax, A, B, C, D, UU)
 
-    
-    elif cfg.Model.upper() == 'VISC_BURGERS':
-        E = Uo*Uo/2
-        A = Uo.copy()
-        cc = 0.5*Courant
-        A[1:-1] = (E[2:] - E[1:-1])/(Uo[2:] - Uo[1:-1])
-        a = [(-diffX - A[i]*cc) for i in range(iMax)]
-        b = [(1.0 + 2.0*diffX) for i in range(iMax)]
-        c = [(-diffX + A[i]*cc) for i in range(iMax)]
-        d = [Uo[i] for i in range(iMax)]
-        UU = Uo.copy()
-        U = trid.TridiagonalSolver(iMax, a, b, c, d, UU)
+    return U
+
+#**************************************************************************
+def _EulersBTCSViscBurgers(cfg, Uo, Courant, diffX):
+    '''EulersBTCS() for the viscous Burgers equation.'''
+    iMax = Uo.shape[0]
+    A = _GetA(cfg, Uo)
+    cc = 0.5*Courant
+    a = -diffX - A*cc
+    b = np.full(iMax, 1.0 + 2.0*diffX, Uo.dtype)
+    c = -diffX + A*cc
+    d = Uo.copy()
+    UU = Uo.copy()
+    U = trid.LapackTridiagonalSolver(iMax, a, b, c, d, UU)
 
     return U
 
@@ -810,28 +1161,27 @@ def CrankNicolson(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    import nanpack.tridiagonal as trid
-
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        cc = 0.25*Courant
-        A = [cc for i in range(cfg.iMax)]
-        B = [-1.0 for i in range(cfg.iMax)]
-        C = [-cc for i in range(cfg.iMax)]
-        D = [0 for i in range(cfg.iMax)]
-        D[1:-1] = -Uo[1:-1] + 0.25*Courant*(Uo[2:]-Uo[0:-2])
-        UU = Uo.copy()
-
-        U = trid.TridiagonalSolver(cfg.iMax, A, B, C, D, UU)
-
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for BURGERS\
- equation in this version.")
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    SolverFunc = _SelectSolver(cfg, 'CrankNicolson')
+    return SolverFunc(cfg, Uo, Courant)
+
+#**************************************************************************
+def _CrankNicolsonWave(cfg, Uo, Courant):
+    '''CrankNicolson() for the first-order wave equation.'''
+    iMax = Uo.shape[0]
+    cc = 0.25*Courant
+    A = np.full(iMax, cc, Uo.dtype)
+    B = np.full(iMax, -1.0, Uo.dtype)
+    C = np.full(iMax, -cc, Uo.dtype)
+    D = np.zeros(iMax, Uo.dtype)
+    D[1:-1] = -Uo[1:-1] + 0.25*Courant*(Uo[2:]-Uo[0:-2])
+    UU = Uo.copy()
+
+    U = trid.LapackTridiagonalSolver(iMax, A, B, C, D, UU)
 
     return U
 
@@ -879,55 +1229,112 @@ def BeamAndWarming(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    import nanpack.tridiagonal as trid
-
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
-    U = Uo.copy() # Initialize U
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    SolverFunc = _SelectSolver(cfg, 'BeamAndWarming')
+    return SolverFunc(cfg, Uo, Courant)
+
+#**************************************************************************
+def _BeamAndWarmingBurgers(cfg, Uo, Courant):
+    '''BeamAndWarming() for the inviscid Burgers equation.'''
+    iMax = Uo.shape[0]
+    E = _GetE(cfg, Uo)
+    cc = 0.25*Courant
+    A = np.empty(iMax, Uo.dtype)
+    B = np.full(iMax, 1.0, Uo.dtype)
+    C = np.empty(iMax, Uo.dtype)
+    D = np.zeros(iMax, Uo.dtype)
+    # The first and last coefficients multiply the boundary values and
+    # are not used by the solver.
+    A[0] = A[-1] = C[0] = C[-1] = 0.0
+    A[1:-1] = -cc*Uo[0:-2]
+    C[1:-1] = cc*Uo[2:]
+    D[1:-1] = Uo[1:-1] - 0.5*Courant*(E[2:]-E[0:-2])\
+              + 0.25*Courant*(Uo[2:]*Uo[2:] - Uo[0:-2]*Uo[0:-2])
+    UU = Uo.copy()
 
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        iMax = shapeU
-        E = Uo*Uo/2
-        cc = 0.25*Courant
-        A = [-cc*Uo[i-1] for i in range(iMax)]
-        B = [1.0 for i in range(iMax)]
-        C = [cc*Uo[i-1] for i in range(iMax)]
-        D = [0.0 for i in range(iMax)]
-        #A[1:-1] = -cc*Uo[0:-2]
-        #C[1:-1] = cc*Uo[2:]
-        D[1:-1] = Uo[1:-1] - 0.5*Courant*(E[2:]-E[0:-2])\
-                  + 0.25*Courant*(Uo[2:]*Uo[2:] - Uo[0:-2]*Uo[0:-2])
-        UU = Uo.copy()
-
-        U = trid.TridiagonalSolver(cfg.iMax, A, B, C, D, UU)
+    U = trid.LapackTridiagonalSolver(iMax, A, B, C, D, UU)
 
     return U
 
 #**************************************************************************
-def FirstOrderTVD(cfg, Uo, Courant):
-    '''Solve a first-order inviscid Burgers equation using the second-
-    order TVD schemes and their various Limiter Functions and Limiters.
+# Specialized formulation of each solver for the available models. The
+# solvers look up this table with the upper-case model name cached on
+# the RunConfig object, so the model is resolved once per call.
+_DISPATCH = {
+    'FO_WAVE': {
+        'ExplicitFirstUpwind': _EFUWave,
+        'Lax': _LaxWave,
+        'LaxWendroff': _LaxWendroffWave,
+        'LaxWendroffMultiStep': _LaxWendroffMultiStepWave,
+        'MacCormack': _MacCormackWave,
+        'FourthOrderRungeKutta': _RK4Wave,
+        'ModifiedRungeKutta': _MRKWave,
+        'EulersBTCS': _EulersBTCSWave,
+        'CrankNicolson': _CrankNicolsonWave,
+        },
+    'INV_BURGERS': {
+        'ExplicitFirstUpwind': _EFUBurgers,
+        'Lax': _LaxBurgers,
+        'LaxWendroff': _LaxWendroffBurgers,
+        'MacCormack': _MacCormackInvBurgers,
+        'FourthOrderRungeKutta': _RK4Burgers,
+        'ModifiedRungeKutta': _MRKBurgers,
+        'BeamAndWarming': _BeamAndWarmingBurgers,
+        },
+    'VISC_BURGERS': {
+        'MacCormack': _MacCormackViscBurgers,
+        'ModifiedRungeKutta': _MRKViscBurgers,
+        'EulersBTCS': _EulersBTCSViscBurgers,
+        },
+    }
+
+def _SelectSolver(cfg, SolverName):
+    '''Return the formulation of SolverName for the model in cfg.'''
+    try:
+        return _DISPATCH[cfg._model_key][SolverName]
+    except KeyError:
+        raise Exception(f"This formulation is not available for\
+ {cfg.Model} equation in this version.") from None
 
-    The Burgers equation is the hyperbolic partial differential equation.
-    The first-order inviscid Burgers equation is a non-linear equation
-    which is expressed as:
+#**************************************************************************
+# Batched formulations of the explicit solvers for the first-order wave
+# equation. B independent problems, stored as the rows of a (B, N)
+# array, are advanced in one call so that the Python overhead of a call
+# is shared by all of them. The Courant number may differ per problem.
+def _BatchSetUp(cfg, Uo, Courant, out):
+    '''Check the inputs of a batched solver. Return Uo in the working
+    precision, the Courant number shaped to broadcast over the rows and
+    the array in which the solution at time level (n+1) is stored.
+    '''
+    if __debug__ and Uo.ndim != 2:
+        raise ValueError("The batched solvers require a 2D array holding\
+ one problem in each row.")
+    if cfg._model_key != 'FO_WAVE':
+        raise Exception(f"The batched formulation is not available for\
+ {cfg.Model} equation in this version.")
 
-                            du/dt = -u(du/dx)   or,
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    Courant = np.asarray(Courant, dtype=Uo.dtype)
+    if Courant.ndim == 1:
+        Courant = Courant[:, None]
+
+    return Uo, Courant, _GetOutput(Uo, out)
+
+#**************************************************************************
+def BatchedExplicitFirstUpwind(cfg, Uo, Courant, out=None):
+    '''Solve a batch of first-order 1D wave equations using the explicit
+    first upwind differencing method.
+
+    Each row of Uo is an independent problem which is advanced by one
+    time step exactly as ExplicitFirstUpwind() would advance it.
 
-                            du/dt = -dE/dx
-    where,
-                u: measurable quanity
-                E = u^2/2
-                
     Call signature:
 
-        FirstOrderTVD(cfg, Uo, Courant)
+        BatchedExplicitFirstUpwind(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -937,78 +1344,49 @@ def FirstOrderTVD(cfg, Uo, Courant):
            Class object of RunConfig class which was created at the
            beginning of the simulation.
 
-    Uo : 1D array
+    Uo : 2D array
 
-         The dependent variable from time level (n) within the domain.
+         The dependent variable from time level (n) within the domain,
+         one problem per row.
 
-    Courant : float
+    Courant : float or 1D array
 
-              Courant number (entered as user input in file).
+              Courant number, either shared by all problems or given
+              for each row.
+
+    out : 2D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
 
     Returns
     -------
 
-    U : 1D array
+    U : 2D array
 
         The dependent variable calculated at time level (n+1) within the
-        entire domain.
+        entire domain of each problem.
     '''
-    import nanpack.secondaryfunctions as sec
-
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
- order wave equation or the inviscid Burgers equation in this version.")
-
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
-
-    U = Uo.copy() # Initialize U
-    #Utemp = Uo.copy()
-    E = Uo*Uo/2
-
-    for i in range (1,cfg.iMax-1):
-        dUiPlus12 = sec.CalcUi(Uo[i+1], Uo[i])
-        dUiMinus12 = sec.CalcUi(Uo[i], Uo[i-1])
-        # -- Calculate alpha(i+1/2) using equation 6-98
-        if dUiPlus12 == 0:
-            alphaiPlus12 = Uo[i]
-        else:
-            alphaiPlus12 = (E[i+1]-E[i]) / dUiPlus12
-        # -- Calculate alpha(i-1/2) using equation 6-100
-        if dUiMinus12 == 0:
-            alphaiMinus12 = Uo[i]
-        else:
-            alphaiMinus12 = (E[i]-E[i-1]) / dUiMinus12
-        # Equation 6-119 and 6-120 in CFD Vol. 1 by Hoffmann
-        phiPlus = abs(alphaiPlus12)*dUiPlus12
-        phiMinus = abs(alphaiMinus12)*dUiMinus12
-        # Equation 6-117 and 6-118 in CFD Vol. 1 by Hoffmann
-        Utemp = Uo[i] - 0.5*Courant*(E[i+1]-E[i-1])
-        U[i] = Utemp + 0.5*Courant*(phiPlus-phiMinus)
+    Uo, Courant, U = _BatchSetUp(cfg, Uo, Courant, out)
+    if cfg._sign_conv > 0:
+        U[:, 1:-1] = Uo[:, 1:-1] - Courant*(Uo[:, 1:-1]-Uo[:, 0:-2])
+    else:
+        U[:, 1:-1] = Uo[:, 1:-1] - Courant*(Uo[:, 2:]-Uo[:, 1:-1])
 
     return U
 
 #**************************************************************************
-def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
-    '''Solve a first-order inviscid Burgers equation using the second-
-    order TVD schemes and their various Limiter Functions and Limiters.
+def BatchedLax(cfg, Uo, Courant, out=None):
+    '''Solve a batch of first-order 1D wave equations using the explicit
+    Lax method.
 
-    The Burgers equation is the hyperbolic partial differential equation.
-    The first-order inviscid Burgers equation is a non-linear equation
-    which is expressed as:
-
-                            du/dt = -u(du/dx)   or,
+    Each row of Uo is an independent problem which is advanced by one
+    time step exactly as Lax() would advance it.
 
-                            du/dt = -dE/dx
-    where,
-                u: measurable quanity
-                E = u^2/2
-                
     Call signature:
 
-        SecondOrderTVD(cfg, Uo, Courant)
+        BatchedLax(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -1018,84 +1396,99 @@ def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
            Class object of RunConfig class which was created at the
            beginning of the simulation.
 
-    Uo : 1D array
+    Uo : 2D array
 
-         The dependent variable from time level (n) within the domain.
+         The dependent variable from time level (n) within the domain,
+         one problem per row.
 
-    Courant : float
+    Courant : float or 1D array
 
-              Courant number (entered as user input in file).
+              Courant number, either shared by all problems or given
+              for each row.
+
+    out : 2D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
 
     Returns
     -------
 
-    U : 1D array
+    U : 2D array
 
         The dependent variable calculated at time level (n+1) within the
-        entire domain.
+        entire domain of each problem.
     '''
-    import nanpack.tvdfunctions as tvd
-    import backend.fetchoptions as fo
+    Uo, Courant, U = _BatchSetUp(cfg, Uo, Courant, out)
+    U[:, 1:-1] = 0.5*(Uo[:, 2:]+Uo[:, 0:-2])\
+                 - 0.5*Courant*(Uo[:, 2:]-Uo[:, 0:-2])
 
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
- order wave equation or the inviscid Burgers equation in this version.")
+    return U
 
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
+#**************************************************************************
+def BatchedLaxWendroff(cfg, Uo, Courant, out=None):
+    '''Solve a batch of first-order 1D wave equations using the explicit
+    Lax-Wendroff method.
 
-    iMax = shapeU
-    U = Uo.copy() # Initialize U
-    E = Uo*Uo/2
+    Each row of Uo is an independent problem which is advanced by one
+    time step exactly as LaxWendroff() would advance it.
 
-    fetch = fo.FetchOptions()
-    limfunc_options = fetch.TVDLimiterFunctionOptions()
+    Call signature:
+
+        BatchedLaxWendroff(cfg, Uo, Courant, out)
 
-    if not LimiterFunc in limfunc_options:
-        raise Exception(f"Invalid flux limiter function selection in the call\
- to function\nSecondOrderTVD().\Valid options for LimiterFunc are:\
- {limfunc_options}.")
+    Parameters
+    ----------
 
-    for i in range (2,iMax-2):
-        phiPlus, phiMinus = tvd.CalculateTVD(i, Uo, E, Eps, Courant,\
-                                             Limiter, LimiterFunc)
+    cfg :
 
-        # Equation 6-124 and 6-125 in Hoffmann Vol. 1
-        hPlus = 0.5 * (E[i+1]+E[i]+phiPlus)
-        hMinus = 0.5 * (E[i]+E[i-1]+phiMinus)
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
 
-        if cfg.Model.upper() == 'VISC_BURGERS':
-            # calculate diffusion terms in the viscous Bergers equation
-            # Equation 7-58
-            diffusion = diffX*(Uo[i+1] - 2.0*Uo[i] + Uo[i-1])
-        else:
-            diffusion = 0.0
+    Uo : 2D array
+
+         The dependent variable from time level (n) within the domain,
+         one problem per row.
+
+    Courant : float or 1D array
+
+              Courant number, either shared by all problems or given
+              for each row.
+
+    out : 2D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
 
-        # Equation 6-123
-        U[i] = Uo[i] - Courant*(hPlus-hMinus) + diffusion
+    U : 2D array
 
+        The dependent variable calculated at time level (n+1) within the
+        entire domain of each problem.
+    '''
+    Uo, Courant, U = _BatchSetUp(cfg, Uo, Courant, out)
+    Courant2 = Courant*Courant
+    U[:, 1:-1] = Uo[:, 1:-1] - 0.5*Courant*(Uo[:, 2:]-Uo[:, 0:-2])\
+                 + 0.5*Courant2*(Uo[:, 2:] - 2.0*Uo[:, 1:-1]\
+                                 + Uo[:, 0:-2])
 
     return U
 
 #**************************************************************************
-#def FluxCorrectedTransport(cfg, Uo, Courant, Damp1, Damp2):
-    '''Solve a first-order 1D wave equation using the Flux Corrected
-    Transport scheme for the Lax-Wendroff method.
-   
-    The wave equation is the hyperbolic partial differential equation.
-    The first-order wave equation is a linear equation which is expressed
-    as:
+def BatchedLaxWendroffMultiStep(cfg, Uo, Courant, out=None):
+    '''Solve a batch of first-order 1D wave equations using the explicit
+    two-step Lax-Wendroff method.
 
-                            du/dt = -a(du/dx)       for a>0
-    where,
-                u: measurable quanity
-                a: constant speed
+    Each row of Uo is an independent problem which is advanced by one
+    time step exactly as LaxWendroffMultiStep() would advance it.
 
     Call signature:
 
-        FluxCorrectedTransport(cfg, Uo, Courant, Damp1, Damp2)
+        BatchedLaxWendroffMultiStep(cfg, Uo, Courant, out)
 
     Parameters
     ----------
@@ -1105,9 +1498,503 @@ def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
            Class object of RunConfig class which was created at the
            beginning of the simulation.
 
-    Uo : 1D array
+    Uo : 2D array
 
-         The dependent variable from time level (n) within the domain.
+         The dependent variable from time level (n) within the domain,
+         one problem per row.
+
+    Courant : float or 1D array
+
+              Courant number, either shared by all problems or given
+              for each row.
+
+    out : 2D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
+
+    U : 2D array
+
+        The dependent variable calculated at time level (n+1) within the
+        entire domain of each problem.
+    '''
+    Uo, Courant, U = _BatchSetUp(cfg, Uo, Courant, out)
+    Uhalf = _GetScratch(cfg, 'BatchUhalf', Uo.shape, Uo.dtype)
+    # Only the left boundary of Uhalf is read by the second step.
+    Uhalf[:, 0] = Uo[:, 0]
+    Uhalf[:, 1:-1] = 0.5*(Uo[:, 2:]+Uo[:, 1:-1])\
+                     - 0.5*Courant*(Uo[:, 2:]-Uo[:, 1:-1])
+    U[:, 1:-1] = Uo[:, 1:-1] - Courant*(Uhalf[:, 1:-1]-Uhalf[:, 0:-2])
+
+    return U
+
+#**************************************************************************
+def BatchedMacCormack(cfg, Uo, Courant, out=None):
+    '''Solve a batch of first-order 1D wave equations using the explicit
+    MacCormack method.
+
+    Each row of Uo is an independent problem which is advanced by one
+    time step exactly as MacCormack() would advance it.
+
+    Call signature:
+
+        BatchedMacCormack(cfg, Uo, Courant, out)
+
+    Parameters
+    ----------
+
+    cfg :
+
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
+
+    Uo : 2D array
+
+         The dependent variable from time level (n) within the domain,
+         one problem per row.
+
+    Courant : float or 1D array
+
+              Courant number, either shared by all problems or given
+              for each row.
+
+    out : 2D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
+
+    U : 2D array
+
+        The dependent variable calculated at time level (n+1) within the
+        entire domain of each problem.
+    '''
+    Uo, Courant, U = _BatchSetUp(cfg, Uo, Courant, out)
+    Utemp = _GetScratch(cfg, 'BatchUtemp', Uo.shape, Uo.dtype)
+    # Only the left boundary of Utemp is read by the corrector step.
+    Utemp[:, 0] = Uo[:, 0]
+    # Predictor step
+    Utemp[:, 1:-1] = Uo[:, 1:-1] - Courant*(Uo[:, 2:]-Uo[:, 1:-1])
+    # Corrector step
+    U[:, 1:-1] = 0.5*((Uo[:, 1:-1]+Utemp[:, 1:-1])\
+                      - Courant*(Utemp[:, 1:-1]-Utemp[:, 0:-2]))
+
+    return U
+
+#**************************************************************************
+def BatchedFourthOrderRungeKutta(cfg, Uo, Courant, out=None):
+    '''Solve a batch of first-order 1D wave equations using the explicit
+    four-stage Runge-Kutta method.
+
+    Each row of Uo is an independent problem which is advanced by one
+    time step exactly as FourthOrderRungeKutta() would advance it.
+
+    Call signature:
+
+        BatchedFourthOrderRungeKutta(cfg, Uo, Courant, out)
+
+    Parameters
+    ----------
+
+    cfg :
+
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
+
+    Uo : 2D array
+
+         The dependent variable from time level (n) within the domain,
+         one problem per row.
+
+    Courant : float or 1D array
+
+              Courant number, either shared by all problems or given
+              for each row.
+
+    out : 2D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
+
+    U : 2D array
+
+        The dependent variable calculated at time level (n+1) within the
+        entire domain of each problem.
+    '''
+    Uo, Courant, U = _BatchSetUp(cfg, Uo, Courant, out)
+    U1 = _GetScratch(cfg, 'BatchU1', Uo.shape, Uo.dtype)
+    U2 = _GetScratch(cfg, 'BatchU2', Uo.shape, Uo.dtype)
+    U3 = _GetScratch(cfg, 'BatchU3', Uo.shape, Uo.dtype)
+    for Ui in (U1, U2, U3):
+        Ui[:, 0] = Uo[:, 0]
+        Ui[:, -1] = Uo[:, -1]
+    # 1st stage
+    U1[:, 1:-1] = Uo[:, 1:-1] - 0.25*Courant*(Uo[:, 2:]-Uo[:, 0:-2])
+    # 2nd stage
+    U2[:, 1:-1] = Uo[:, 1:-1] - 0.25*Courant*(U1[:, 2:]-U1[:, 0:-2])
+    # 3rd stage
+    U3[:, 1:-1] = Uo[:, 1:-1] - 0.5*Courant*(U2[:, 2:]-U2[:, 0:-2])
+    # 4th stage
+    U[:, 1:-1] = Uo[:, 1:-1]\
+                 - 0.5*Courant\
+                 * (((1.0/6)*(Uo[:, 2:] - Uo[:, 0:-2]))\
+                    + ((1.0/3)*(U1[:, 2:] - U1[:, 0:-2]))\
+                    + ((1.0/3)*(U2[:, 2:] - U2[:, 0:-2]))\
+                    + ((1.0/6)*(U3[:, 2:] - U3[:, 0:-2])))
+
+    return U
+
+#**************************************************************************
+def BatchedModifiedRungeKutta(cfg, Uo, Courant, out=None):
+    '''Solve a batch of first-order 1D wave equations using the explicit
+    four-stage Modified Runge-Kutta method.
+
+    Each row of Uo is an independent problem which is advanced by one
+    time step exactly as ModifiedRungeKutta() would advance it.
+
+    Call signature:
+
+        BatchedModifiedRungeKutta(cfg, Uo, Courant, out)
+
+    Parameters
+    ----------
+
+    cfg :
+
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
+
+    Uo : 2D array
+
+         The dependent variable from time level (n) within the domain,
+         one problem per row.
+
+    Courant : float or 1D array
+
+              Courant number, either shared by all problems or given
+              for each row.
+
+    out : 2D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
+
+    U : 2D array
+
+        The dependent variable calculated at time level (n+1) within the
+        entire domain of each problem.
+    '''
+    Uo, Courant, U = _BatchSetUp(cfg, Uo, Courant, out)
+    Ustage = _GetScratch(cfg, 'BatchUstage', Uo.shape, Uo.dtype)
+    Ustage[:, 0] = Uo[:, 0]
+    Ustage[:, -1] = Uo[:, -1]
+    # The stages alternate between Ustage and U, the last one is U.
+    Uprev = Uo
+    for Unew, div in ((Ustage, 8.0), (U, 6.0), (Ustage, 4.0), (U, 2.0)):
+        Unew[:, 1:-1] = Uo[:, 1:-1]\
+                        - Courant*(Uprev[:, 2:]-Uprev[:, 0:-2])/div
+        # -- update BC here (required when Neumann BC is used)
+        Uprev = Unew
+
+    return U
+
+#**************************************************************************
+@_Validate1D(('FO_WAVE',))
+def FirstOrderTVD(cfg, Uo, Courant, out=None):
+    '''Solve a first-order inviscid Burgers equation using the second-
+    order TVD schemes and their various Limiter Functions and Limiters.
+
+    The Burgers equation is the hyperbolic partial differential equation.
+    The first-order inviscid Burgers equation is a non-linear equation
+    which is expressed as:
+
+                            du/dt = -u(du/dx)   or,
+
+                            du/dt = -dE/dx
+    where,
+                u: measurable quanity
+                E = u^2/2
+                
+    Call signature:
+
+        FirstOrderTVD(cfg, Uo, Courant, out)
+
+    Parameters
+    ----------
+
+    cfg :
+
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
+
+    Uo : 1D array
+
+         The dependent variable from time level (n) within the domain.
+
+    Courant : float
+
+              Courant number (entered as user input in file).
+
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
+
+    U : 1D array
+
+        The dependent variable calculated at time level (n+1) within the
+        entire domain.
+    '''
+    xp = cfg.xp
+    Uo = xp.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutputEnds(Uo, out, 1, xp)
+    # the work arrays on cfg are host arrays
+    E = _GetE(cfg, Uo) if xp is np else 0.5*Uo*Uo
+
+    dUiPlus12 = Uo[2:] - Uo[1:-1]
+    dUiMinus12 = Uo[1:-1] - Uo[0:-2]
+    # -- Calculate alpha(i+1/2) using equation 6-98 and alpha(i-1/2)
+    # using equation 6-100. For E = u^2/2 they reduce to the average of
+    # u on either side of the face, which is also the value where the
+    # difference of u vanishes.
+    alphaiPlus12 = 0.5*(Uo[2:]+Uo[1:-1])
+    alphaiMinus12 = 0.5*(Uo[1:-1]+Uo[0:-2])
+    # Equation 6-119 and 6-120 in CFD Vol. 1 by Hoffmann
+    phiPlus = xp.abs(alphaiPlus12)*dUiPlus12
+    phiMinus = xp.abs(alphaiMinus12)*dUiMinus12
+    # Equation 6-117 and 6-118 in CFD Vol. 1 by Hoffmann
+    U[1:-1] = Uo[1:-1] - 0.5*Courant*(E[2:]-E[0:-2])\
+              + 0.5*Courant*(phiPlus-phiMinus)
+
+    return U
+
+#**************************************************************************
+# The TVD kernels call the compiled functions of tvdfunctions, limiters
+# and secondaryfunctions. Numba checks only this file before it reuses
+# the cached kernels, delete the *.nbi and *.nbc files in __pycache__
+# after editing those modules.
+@njit(inline='always')
+def _SecondOrderTVDPoint(uim2, uim1, ui, uip1, uip2, Courant, Eps,
+                         limfunc, limiter):
+    '''Second-order TVD update of the inviscid Burgers equation at the
+    point i from its two neighbours on either side, E = u^2/2 being
+    formed on the fly.
+    '''
+    dUiMinus32 = sf.CalcUi(uim1, uim2)
+    dUiMinus12 = sf.CalcUi(ui, uim1)
+    dUiPlus12 = sf.CalcUi(uip1, ui)
+    dUiPlus32 = sf.CalcUi(uip2, uip1)
+    # Equation 6-128
+    alphaiMinus32 = sf.CalcAlphaBurgers(uim1, uim2)
+    alphaiMinus12 = sf.CalcAlphaBurgers(ui, uim1)
+    alphaiPlus12 = sf.CalcAlphaBurgers(uip1, ui)
+    alphaiPlus32 = sf.CalcAlphaBurgers(uip2, uip1)
+    phiPlus, phiMinus = tvd.CalculateTVDPhi(dUiMinus32, dUiMinus12,\
+                            dUiPlus12, dUiPlus32, alphaiMinus32,\
+                            alphaiMinus12, alphaiPlus12, alphaiPlus32,\
+                            Eps, Courant, limiter, limfunc)
+    Em = sf.CalcE(uim1)
+    Ei = sf.CalcE(ui)
+    Ep = sf.CalcE(uip1)
+    # Equation 6-124 and 6-125 in Hoffmann Vol. 1
+    hPlus = 0.5*(Ep + Ei + phiPlus)
+    hMinus = 0.5*(Ei + Em + phiMinus)
+    # Equation 6-123
+    return ui - Courant*(hPlus - hMinus)
+
+@stencil(neighborhood=((-2, 2),))
+def _SecondOrderTVDStencil(u, Courant, Eps, limfunc, limiter):
+    '''Second-order TVD stencil of the inviscid Burgers equation.'''
+    return _SecondOrderTVDPoint(u[-2], u[-1], u[0], u[1], u[2],\
+                                Courant, Eps, limfunc, limiter)
+
+@stencil(neighborhood=((-2, 2),))
+def _SecondOrderTVDViscStencil(u, Courant, Eps, limfunc, limiter,
+                               diffX):
+    '''Second-order TVD stencil of the viscous Burgers equation, the
+    diffusion term is that of Equation 7-58.
+    '''
+    return _SecondOrderTVDPoint(u[-2], u[-1], u[0], u[1], u[2],\
+                                Courant, Eps, limfunc, limiter)\
+           + diffX*(u[1] - 2.0*u[0] + u[-1])
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _SecondOrderTVDKernel(Uo, Courant, Eps, limfunc, limiter, U):
+    '''Apply the second-order TVD stencil at the points 2 to iMax-3,
+    the two points at either end of U are left unchanged.
+    '''
+    _SecondOrderTVDStencil(Uo, Courant, Eps, limfunc, limiter,\
+                           out=U)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _SecondOrderTVDViscKernel(Uo, Courant, Eps, limfunc, limiter,
+                              diffX, U):
+    '''_SecondOrderTVDKernel() for the viscous Burgers equation.'''
+    _SecondOrderTVDViscStencil(Uo, Courant, Eps, limfunc, limiter,\
+                               diffX, out=U)
+
+#**************************************************************************
+@_Validate1D(('FO_WAVE',))
+def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1,
+                   diffX=None, out=None):
+    '''Solve a first-order inviscid or viscous Burgers equation using
+    the second-order TVD schemes and their various Limiter Functions and
+    Limiters.
+
+    The Burgers equation is the hyperbolic partial differential equation.
+    The first-order inviscid Burgers equation is a non-linear equation
+    which is expressed as:
+
+                            du/dt = -u(du/dx)   or,
+
+                            du/dt = -dE/dx
+    where,
+                u: measurable quanity
+                E = u^2/2
+                
+    Call signature:
+
+        SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps,
+                       diffX, out)
+
+    Parameters
+    ----------
+
+    cfg :
+
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
+
+    Uo : 1D array
+
+         The dependent variable from time level (n) within the domain.
+
+    Courant : float
+
+              Courant number (entered as user input in file).
+
+    LimiterFunc : str
+
+                  The TVD limiter function.
+
+    Limiter : str
+
+              The limiter of the TVD limiter function.
+
+    Eps : float, optional
+
+          Entropy correction parameter, within the range 0.0 to 0.125.
+
+    diffX : float, optional
+
+            Diffusion number, required for the viscous Burgers equation.
+
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
+
+    U : 1D array
+
+        The dependent variable calculated at time level (n+1) within the
+        entire domain.
+    '''
+    viscous = cfg._model_key == 'VISC_BURGERS'
+    if viscous and diffX is None:
+        raise Exception("The diffusion number diffX is required for the\
+ viscous Burgers equation.")
+
+    # Initialize U, the kernel updates the points 2 to iMax-3 only
+    xp = cfg.xp
+    Uo = xp.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutputEnds(Uo, out, 2, xp)
+
+    limfunc, limiter = TVDLimiterCodes(LimiterFunc, Limiter)
+    if xp is not np:
+        _SecondOrderTVDArray(xp, Uo, Courant, Eps, LimiterFunc,\
+                             Limiter, diffX if viscous else None, U)
+    elif viscous:
+        _SecondOrderTVDViscKernel(Uo, Courant, Eps, limfunc,\
+                                  limiter, diffX, U)
+    else:
+        _SecondOrderTVDKernel(Uo, Courant, Eps, limfunc, limiter, U)
+
+    return U
+
+#**************************************************************************
+def _SecondOrderTVDArray(xp, Uo, Courant, Eps, LimiterFunc, Limiter,
+                         diffX, U):
+    '''SecondOrderTVD() in array expressions of the array module xp, for
+    arrays on the GPU with CuPy. diffX is None for the inviscid Burgers
+    equation.
+    '''
+    # whole-array limiter functions for arrays on the GPU
+    E = 0.5*Uo*Uo
+    phiPlus, phiMinus = tvd.CalculateTVDVectorized(Uo, E, Eps,\
+                            Courant, Limiter, LimiterFunc, xp)
+    # Equation 6-123 to 6-125 in Hoffmann Vol. 1
+    U[2:-2] = Uo[2:-2] - 0.5*Courant*(E[3:-1] - E[1:-3]\
+                                      + phiPlus - phiMinus)
+
+    if diffX is not None:
+        # calculate diffusion terms in the viscous Bergers equation
+        # Equation 7-58
+        U[2:-2] += diffX*(Uo[3:-1] - 2.0*Uo[2:-2] + Uo[1:-3])
+
+    return U
+
+#**************************************************************************
+#def FluxCorrectedTransport(cfg, Uo, Courant, Damp1, Damp2):
+    '''Solve a first-order 1D wave equation using the Flux Corrected
+    Transport scheme for the Lax-Wendroff method.
+   
+    The wave equation is the hyperbolic partial differential equation.
+    The first-order wave equation is a linear equation which is expressed
+    as:
+
+                            du/dt = -a(du/dx)       for a>0
+    where,
+                u: measurable quanity
+                a: constant speed
+
+    Call signature:
+
+        FluxCorrectedTransport(cfg, Uo, Courant, Damp1, Damp2)
+
+    Parameters
+    ----------
+
+    cfg :
+
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
+
+    Uo : 1D array
+
+         The dependent variable from time level (n) within the domain.
 
     Courant : float
 
@@ -1131,9 +2018,8 @@ def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
         entire domain.
     '''
 '''    import fluid.secondaryfunctions as sf
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
+    if __debug__ and Uo.ndim != 1:
+        raise ValueError("This formulation is only available for 1D first\
  order wave equation or the inviscid Burgers equation in this version.")
 
     U = Uo.copy() # Initialize U
@@ -1157,7 +2043,65 @@ def SecondOrderTVD(cfg, Uo, Courant, LimiterFunc, Limiter, Eps=0.1):
 
     return U'''
 #**************************************************************************
-def FTCS(cfg, Uo, Courant, diffX):
+@njit(inline='always')
+def _FaceSpeed(Uo, j, n):
+    '''A = dE/du of the Burgers equation at (j+1/2), (u(j+1)+u(j))/2,
+    and u at the end points.
+    '''
+    if j == 0 or j == n - 1:
+        return Uo[j]
+    return 0.5*(Uo[j+1] + Uo[j])
+
+#**************************************************************************
+@njit(parallel=True, fastmath=True, cache=True)
+def _FTCSKernel(Uo, Courant, diffX, U):
+    '''FTCS update of the viscous Burgers equation, A is formed on the
+    fly.
+    '''
+    n = Uo.shape[0]
+    for i in prange(1, n-1):
+        um = Uo[i-1]
+        u0 = Uo[i]
+        up = Uo[i+1]
+        A2 = _FaceSpeed(Uo, i+1, n) + _FaceSpeed(Uo, i-1, n)
+        U[i] = u0 - 0.5*0.5*Courant*A2*(up - um)\
+               + diffX*(up - 2.0*u0 + um)
+
+#**************************************************************************
+@njit(parallel=True, fastmath=True, cache=True)
+def _FTBCSKernel(Uo, Courant, diffX, U):
+    '''FTBCS update of the viscous Burgers equation, A is formed on the
+    fly.
+    '''
+    n = Uo.shape[0]
+    for i in prange(1, n-1):
+        um = Uo[i-1]
+        u0 = Uo[i]
+        up = Uo[i+1]
+        A2 = _FaceSpeed(Uo, i+1, n) + _FaceSpeed(Uo, i-1, n)
+        U[i] = u0 - 0.5*Courant*A2*(u0 - um)\
+               + diffX*(up - 2.0*u0 + um)
+
+#**************************************************************************
+def _FTCSArray(xp, Uo, Courant, diffX, out):
+    '''FTCS update of the viscous Burgers equation in array expressions
+    of the array module xp, for arrays on the GPU with CuPy.
+    '''
+    U = _GetOutputEnds(Uo, out, 1, xp)
+    # A = dE/du at (i+1/2), u at the end points
+    A = xp.empty_like(Uo)
+    A[0] = Uo[0]
+    A[-1] = Uo[-1]
+    A[1:-1] = 0.5*(Uo[2:] + Uo[1:-1])
+    U[1:-1] = Uo[1:-1] - 0.5*0.5*Courant*(A[2:] + A[0:-2])\
+              *(Uo[2:] - Uo[0:-2])\
+              + diffX*(Uo[2:] - 2.0*Uo[1:-1] + Uo[0:-2])
+
+    return U
+
+#**************************************************************************
+@_Validate1D(('FO_WAVE', 'INV_BURGERS'))
+def FTCS(cfg, Uo, Courant, diffX, out=None):
     '''Solve a 1D non-linear viscous Burgers equation using the explicit
     forward time central space (FTCS) differencing method.
 
@@ -1178,7 +2122,7 @@ def FTCS(cfg, Uo, Courant, diffX):
                 
     Call signature:
 
-        FTCS(cfg, Uo, Courant, diffX)
+        FTCS(cfg, Uo, Courant, diffX, out)
 
     Parameters
     ----------
@@ -1196,6 +2140,12 @@ def FTCS(cfg, Uo, Courant, diffX):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -1204,31 +2154,158 @@ def FTCS(cfg, Uo, Courant, diffX):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
- order wave equation or the inviscid Burgers equation in this version.")
+    Uo = cfg.xp.ascontiguousarray(Uo, dtype=cfg.dtype)
+    if cfg.xp is not np:
+        return _FTCSArray(cfg.xp, Uo, Courant, diffX, out)
 
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
+    U = _GetOutputEnds(Uo, out, 1)
+    _FTCSKernel(Uo, Courant, diffX, U)
 
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
+    return U
 
-    U = Uo.copy() # Initialize U
-    A = Uo.copy() # Initialize A
-    E = Uo*Uo/2
-    A[1:-1] = (E[2:]-E[1:-1]) / (Uo[2:]-Uo[1:-1])
-    U[1:-1] = Uo[1:-1]\
-              - 0.5*0.5*Courant*(A[2:]+A[0:-2])*(Uo[2:]-Uo[0:-2])\
-              + diffX*(Uo[2:] - 2.0*Uo[1:-1] + Uo[0:-2])
+#**************************************************************************
+# Temporal blocking of FTCS. The domain is split into tiles of
+# _FTCS_TILE points which are advanced by up to _FTCS_TBLOCK time steps
+# at a time in a small local buffer, together with a halo of two points
+# per time step on either side (the face speed at (i+1) depends on
+# u(i+2)), so that a tile stays in cache for all of these steps. Tiles
+# are processed in parallel.
+_FTCS_TILE = 4096
+_FTCS_TBLOCK = 16
+
+@njit(inline='always')
+def _FTCSPoint(W, k, g, n, Courant, diffX):
+    '''FTCS update of the local point k of W, which is the point g of a
+    domain of n points.
+    '''
+    um = W[k-1]
+    u0 = W[k]
+    up = W[k+1]
+    Ap = up if g + 1 == n - 1 else 0.5*(W[k+2] + up)
+    Am = um if g - 1 == 0 else 0.5*(u0 + um)
+    return u0 - 0.5*0.5*Courant*(Ap + Am)*(up - um)\
+           + diffX*(up - 2.0*u0 + um)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _FTCSnStepsKernel(Uo, Courant, diffX, nSteps, U, Utemp):
+    '''Advance Uo by nSteps FTCS time steps with temporal blocking.
+    Uo is left unchanged, the result is returned in either U or Utemp.
+    '''
+    n = Uo.shape[0]
+    nTiles = (n + _FTCS_TILE - 1)//_FTCS_TILE
+    Ucur = Uo
+    Unew = U
+    done = 0
+    while done < nSteps:
+        nt = min(_FTCS_TBLOCK, nSteps - done)
+        for tile in prange(nTiles):
+            s = tile*_FTCS_TILE
+            e = min(s + _FTCS_TILE, n)
+            lo = max(s - 2*nt, 0)
+            hi = min(e + 2*nt, n)
+            W0 = Ucur[lo:hi].copy()
+            W1 = W0.copy()
+            for t in range(1, nt + 1):
+                # points whose dependence on the halo is still valid
+                gs = 1 if lo == 0 else lo + 2*t
+                ge = n - 2 if hi == n else hi - 1 - 2*t
+                # the end points 1 and n-2 take the face speed from
+                # the boundary values, the points between them do not
+                if gs == 1 and ge >= 1:
+                    W1[1-lo] = _FTCSPoint(W0, 1-lo, 1, n, Courant, diffX)
+                for k in range(max(gs, 2) - lo, min(ge, n - 3) + 1 - lo):
+                    um = W0[k-1]
+                    u0 = W0[k]
+                    up = W0[k+1]
+                    A2 = 0.5*(W0[k+2] + up) + 0.5*(u0 + um)
+                    W1[k] = u0 - 0.5*0.5*Courant*A2*(up - um)\
+                            + diffX*(up - 2.0*u0 + um)
+                if ge == n - 2 and n > 3:
+                    W1[n-2-lo] = _FTCSPoint(W0, n-2-lo, n-2, n, Courant,\
+                                            diffX)
+                W0, W1 = W1, W0
+            Unew[s:e] = W0[s-lo:e-lo]
+        done += nt
+        if Unew is U:
+            Ucur = U
+            Unew = Utemp
+        else:
+            Ucur = Utemp
+            Unew = U
+    return Ucur
 
-    return U
+@_Validate1D(('FO_WAVE', 'INV_BURGERS'))
+def FTCSnSteps(cfg, Uo, Courant, diffX, nSteps, out=None):
+    '''Solve a 1D non-linear viscous Burgers equation over several time
+    steps of the explicit forward time central space (FTCS) differencing
+    method in a single call.
+
+    The result is the same as that of calling FTCS() nSteps times, the
+    time steps are however advanced in compiled code and blocked in time
+    so that each part of the domain is kept in cache over several time
+    steps.
+
+    Call signature:
+
+        FTCSnSteps(cfg, Uo, Courant, diffX, nSteps, out)
+
+    Parameters
+    ----------
+
+    cfg :
+
+           Class object of RunConfig class which was created at the
+           beginning of the simulation.
+
+    Uo : 1D array
+
+         The dependent variable from time level (n) within the domain.
+
+    Courant : float
+
+              Courant number (entered as user input in file).
+
+    diffX : float
+
+            Diffusion number.
+
+    nSteps : int
+
+             Number of time steps to advance.
+
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
+    Returns
+    -------
+
+    U : 1D array
+
+        The dependent variable calculated at time level (n+nSteps)
+        within the entire domain.
+    '''
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    if nSteps < 1:
+        return _GetOutput(Uo, out)
+
+    if out is None:
+        return _FTCSnStepsKernel(Uo, Courant, diffX, nSteps,\
+                                 np.empty_like(Uo), np.empty_like(Uo))
+
+    _CheckOutput(Uo, out)
+    # the kernel returns either out or the work array
+    Utemp = _GetScratch(cfg, 'Utemp', Uo.shape, Uo.dtype)
+    U = _FTCSnStepsKernel(Uo, Courant, diffX, nSteps, out, Utemp)
+    if U is not out:
+        np.copyto(out, U)
+    return out
 
 #**************************************************************************
-def FTBCS(cfg, Uo, Courant, diffX):
+@_Validate1D(('FO_WAVE', 'INV_BURGERS'))
+def FTBCS(cfg, Uo, Courant, diffX, out=None):
     '''Solve a 1D non-linear viscous Burgers equation using the explicit
     forward time central space (FTCS) with backward differencing approxi-
     mation for the convective term.
@@ -1250,7 +2327,7 @@ def FTBCS(cfg, Uo, Courant, diffX):
                 
     Call signature:
 
-        FTBCS(cfg, Uo, Courant, diffX)
+        FTBCS(cfg, Uo, Courant, diffX, out)
 
     Parameters
     ----------
@@ -1268,6 +2345,12 @@ def FTBCS(cfg, Uo, Courant, diffX):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -1276,31 +2359,94 @@ def FTBCS(cfg, Uo, Courant, diffX):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
- order wave equation or the inviscid Burgers equation in this version.")
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    U = _GetOutputEnds(Uo, out, 1)
+    _FTBCSKernel(Uo, Courant, diffX, U)
 
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
+    return U
 
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
+#**************************************************************************
+@njit(inline='always')
+def _StepArrays(Uo_ptr, U_ptr, iMax):
+    '''Arrays of the pointers passed to a compiled timestep, with the
+    boundary values of U copied from Uo.
+    '''
+    Uo = carray(Uo_ptr, iMax)
+    U = carray(U_ptr, iMax)
+    U[0] = Uo[0]
+    U[iMax-1] = Uo[iMax-1]
+    return Uo, U
+
+def _FTCSStep(Uo_ptr, U_ptr, iMax, Courant, diffX):
+    '''Timestep of FTCS() compiled by CompiledStep().'''
+    Uo, U = _StepArrays(Uo_ptr, U_ptr, iMax)
+    _FTCSKernel(Uo, Courant, diffX, U)
+
+def _FTBCSStep(Uo_ptr, U_ptr, iMax, Courant, diffX):
+    '''Timestep of FTBCS() compiled by CompiledStep().'''
+    Uo, U = _StepArrays(Uo_ptr, U_ptr, iMax)
+    _FTBCSKernel(Uo, Courant, diffX, U)
+
+# C-callable timesteps of the viscous Burgers solvers, compiled on first
+# request and kept for the rest of the session. The steps are module
+# level functions so that Numba can reuse their cached machine code.
+_STEP_FUNCTIONS = {'FTCS': _FTCSStep, 'FTBCS': _FTBCSStep}
+_STEP_SIGNATURE = types.void(types.CPointer(types.float64),
+                             types.CPointer(types.float64), types.intc,
+                             types.float64, types.float64)
+_COMPILED_STEPS = {}
+
+def CompiledStep(SolverName):
+    '''Return one timestep of an explicit viscous Burgers solver compiled
+    as a C function, for time-marching loops written in C, Fortran,
+    Cython or Numba which call the solver without going through Python.
+
+    The C signature of the function is:
+
+        void step(double *Uo, double *U, int iMax, double Courant,
+                  double diffX)
+
+    where Uo and U point to iMax contiguous values at time levels (n)
+    and (n+1). U is overwritten within the entire domain, the boundary
+    values are copied from Uo.
 
-    U = Uo.copy() # Initialize U
-    A = Uo.copy() # Initialize A
-    E = Uo*Uo/2
-    A[1:-1] = (E[2:]-E[1:-1]) / (Uo[2:]-Uo[1:-1])
-    U[1:-1] = Uo[1:-1]\
-              - 0.5*Courant*(A[2:]+A[0:-2])*(Uo[1:-1]-Uo[0:-2])\
-              + diffX*(Uo[2:] - 2.0*Uo[1:-1] + Uo[0:-2])
+    Call signature:
 
-    return U
+        CompiledStep(SolverName)
+
+    Parameters
+    ----------
+
+    SolverName : str
+
+                 The explicit solver, "FTCS" or "FTBCS".
+
+    Returns
+    -------
+
+    step : numba CFunc
+
+           The compiled timestep. step.address is the address of the C
+           function and step.ctypes is a ctypes function object which
+           may be called from Python.
+    '''
+    if SolverName not in _STEP_FUNCTIONS:
+        raise Exception(f"A compiled timestep is not available for\
+ {SolverName} in this version.\nValid options are\
+ {tuple(_STEP_FUNCTIONS)}.")
+
+    if SolverName not in _COMPILED_STEPS:
+        # Start the threading layer of the parallel kernels, a C function
+        # loaded from the cache does not start it and fails to link.
+        get_num_threads()
+        _COMPILED_STEPS[SolverName] = cfunc(_STEP_SIGNATURE, cache=True)(
+            _STEP_FUNCTIONS[SolverName])
+
+    return _COMPILED_STEPS[SolverName]
 
 #**************************************************************************
-def DuFortFrankel(cfg, Uo, Uo2, Courant, diffX):
+@_Validate1D(('FO_WAVE', 'INV_BURGERS'))
+def DuFortFrankel(cfg, Uo, Uo2, Courant, diffX, out=None):
     '''Solve a 1D non-linear viscous Burgers equation using the explicit
     DuFort-Frankel differencing method.
 
@@ -1321,7 +2467,7 @@ def DuFortFrankel(cfg, Uo, Uo2, Courant, diffX):
                 
     Call signature:
 
-        DuFortFrankel(cfg, Uo, Uo2, Courant, diffX)
+        DuFortFrankel(cfg, Uo, Uo2, Courant, diffX, out)
 
     Parameters
     ----------
@@ -1339,6 +2485,12 @@ def DuFortFrankel(cfg, Uo, Uo2, Courant, diffX):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -1347,33 +2499,27 @@ def DuFortFrankel(cfg, Uo, Uo2, Courant, diffX):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
- order wave equation or the inviscid Burgers equation in this version.")
-
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
-
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
-
-    iMax = shapeU
-    U = Uo.copy() # Initialize U
-    E = Uo*Uo/2
-    for i in range(1,iMax):
-        A = (E[i+1]-E[i])/(Uo[i+1]-Uo[i])
-        c = A*Courant
-        U[i] = ((1.0 - 2.0*diffX) / (1.0 + 2.0*diffX))*Uo2[i]\
-               + ((c + 2.0*diffX) / (1.0 + 2.0*diffX))*Uo[i-1]\
-               - ((c - 2.0*d) / (1.0 + 2.0*d))*Uo[i+1]
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    Uo2 = np.ascontiguousarray(Uo2, dtype=cfg.dtype)
+    U = _GetOutputEnds(Uo, out, 1)
+    c = 0.5*(Uo[2:]+Uo[1:-1])*Courant
+    U[1:-1] = ((1.0 - 2.0*diffX) / (1.0 + 2.0*diffX))*Uo2[1:-1]\
+              + ((c + 2.0*diffX) / (1.0 + 2.0*diffX))*Uo[0:-2]\
+              - ((c - 2.0*diffX) / (1.0 + 2.0*diffX))*Uo[2:]
 
     return U
 
 #**************************************************************************
-def BTBCS(cfg, Uo, Courant, diffX, Accuracy):
+# Coefficients theta 1 to 4 of the backward differencing approximation
+# of the convective term in BTBCS for each order of accuracy.
+_BTBCS_TH = {
+    "first-order" : (1.0, 1.0, 0.0, 0.0),
+    "second-order" : (2.0, 1.5, 0.0, -0.5),
+    "third-order" : (1.0, 0.5, 1.0/3, -1.0/6)
+    }
+
+@_Validate1D(('FO_WAVE', 'INV_BURGERS'))
+def BTBCS(cfg, Uo, Courant, diffX, Accuracy, out=None):
     '''Solve a 1D non-linear viscous Burgers equation using the implicit
     backward time central spacing (BTBCS) method with backward differencing
     approximation for the convective term.
@@ -1395,7 +2541,7 @@ def BTBCS(cfg, Uo, Courant, diffX, Accuracy):
                 
     Call signature:
 
-        BTBCS(cfg, Uo, Courant, diffX, Accuracy)
+        BTBCS(cfg, Uo, Courant, diffX, Accuracy, out)
 
     Parameters
     ----------
@@ -1413,6 +2559,12 @@ def BTBCS(cfg, Uo, Courant, diffX, Accuracy):
 
               Courant number (entered as user input in file).
 
+    out : 1D array, optional
+
+          Array in which the result is stored. It must have the same
+          shape as Uo and must not overlap Uo. If not given, a new
+          array is returned.
+
     Returns
     -------
 
@@ -1421,38 +2573,24 @@ def BTBCS(cfg, Uo, Courant, diffX, Accuracy):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    import nanpack.tridiagonal as trid
-
-    shapeU = Uo.shape # Obtain Dimension
-    if len(shapeU) == 2:
-        raise Exception("This formulation is only available for 1D first\
- order wave equation or the inviscid Burgers equation in this version.")
-
-    if cfg.Model.upper() == 'FO_WAVE':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
-
-    elif cfg.Model.upper() == 'INV_BURGERS':
-        raise Exception("This formulation is not available for WAVE\
- equation in this version.")
-
-    if Accuracy.lower() == 'first-order':
-        th={"1"=1.0, "2"=1.0, "3"=0.0, "4"=0.0}
-    elif Accuracy.lower == 'second-order':
-        th={"1"=2.0, "2"=3.0/2, "3"=0.0, "4"=-1.0/2}
-    elif Accuracy.lower == 'third-order':
-        th={"1"=1.0, "2"=1.0/2, "3"=1.0/3, "4"=-1.0/6}
-    else:
+    try:
+        th = _BTBCS_TH[Accuracy.lower()]
+    except KeyError:
         raise Exception('Invalid input for argument - Accuracy')
 
-    iMax = shapeU
-    E = Uo*Uo/2
-    A[1:-1] = ([E[2:]-E[0:-2]) / (Uo[2:]-Uo[0:-2])
-    a = [(-diffX - th(1)*A[i]*Courant) for i in range(iMax)]
-    b = [(1.0 + 2.0*diffX + th(2)*A[i]*Courant) for i in range(iMax)]
-    c = [(-diffX + th(3)*A[i]*Courant) for i in range(iMax)]
-    d = [(Uo[i] + th(4)*A[i]*Courant*Uo[i-2]) for i in range(2,cfg.iMax)]
-    UU = Uo.copy()
-    U = trid.TridiagonalSolver(iMax, a, b, c, d, UU)
+    Uo = np.ascontiguousarray(Uo, dtype=cfg.dtype)
+    iMax = Uo.shape[0]
+    A = np.empty(iMax, cfg.dtype)
+    A[0] = Uo[0]
+    A[-1] = Uo[-1]
+    A[1:-1] = 0.5*(Uo[2:]+Uo[0:-2])
+    ACourant = A*Courant
+    a = -diffX - th[0]*ACourant
+    b = (1.0 + 2.0*diffX) + th[1]*ACourant
+    c = -diffX + th[2]*ACourant
+    d = Uo.copy()
+    d[2:] += th[3]*ACourant[2:]*Uo[0:-2]
+    UU = _GetOutput(Uo, out)
+    U = trid.LapackTridiagonalSolver(iMax, a, b, c, d, UU)
 
     return U
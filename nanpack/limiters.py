@@ -5,49 +5,173 @@
 # 2. DICTIONARY FOR LIMITERS IN ROE-SWEBY UPWIND TVD
 # 3. DICTIONARY FOR LIMITERS IN DAVIS-YEE SYMMETRIC TVD
 
+from enum import IntEnum
+from math import fabs
+from numba import njit
+import nanpack.secondaryfunctions as sf
+
+# The limiters are compiled with Numba so that the compiled TVD kernels
+# of the solvers call the same functions as the Python code, with the
+# limiter given by its TVDLimiter code.
+
 #**************************************************************************
-def LimiterforHYU(dU1, dU2, Limiter):
-    ''' A dictionary to call a function based on the required limiter for
-    the Modified Harten-Yee Upwind TVD scheme.
+# Integer codes of the TVD limiter functions and of the limiters, used in
+# place of their names by the compiled solvers. Numba treats the members
+# as integer constants.
+class TVDLimiterFunc(IntEnum):
+    HARTEN_YEE_UPWIND = 0
+    MODIFIED_HARTEN_YEE_UPWIND = 1
+    ROE_SWEBY_UPWIND = 2
+    DAVIS_YEE_SYMMETRIC = 3
+
+class TVDLimiter(IntEnum):
+    G = 0
+    G1 = 1
+    G2 = 2
+    G3 = 3
+    G4 = 4
+    G5 = 5
+
+# Code and available limiters of each TVD limiter function.
+TVDLimiterOptions = {
+    "Harten-Yee-Upwind" : (TVDLimiterFunc.HARTEN_YEE_UPWIND, ("G",)),
+    "Modified-Harten-Yee-Upwind" :
+        (TVDLimiterFunc.MODIFIED_HARTEN_YEE_UPWIND,
+         ("G1", "G2", "G3", "G4", "G5")),
+    "Roe-Sweby-Upwind" :
+        (TVDLimiterFunc.ROE_SWEBY_UPWIND, ("G1", "G2", "G3")),
+    "Davis-Yee-Symmetric" :
+        (TVDLimiterFunc.DAVIS_YEE_SYMMETRIC, ("G1", "G2", "G3"))
+    }
+
+#**************************************************************************
+def TVDLimiterCodes(LimFunction, Limiter):
+    '''Check the TVD limiter function and limiter names and return their
+    integer codes.
     '''
-    lim = {
-        "G1" : LimiterG1forHYU,
-        "G2" : LimiterG2forHYU,
-        "G3" : LimiterG3forHYU,
-        "G4" : LimiterG4forHYU,
-        "G5" : LimiterG5forHYU
-        }
+    if not LimFunction in TVDLimiterOptions:
+        raise Exception(f"Invalid TVD limiter function {LimFunction}.\
+\nValid options are {list(TVDLimiterOptions)}.")
+
+    LimFuncCode, limiters = TVDLimiterOptions[LimFunction]
+    if not Limiter in limiters:
+        raise Exception(f"Invalid TVD limiter for the {LimFunction} TVD.\
+\nValid options are {limiters}.")
 
-    SelectedFunction = lim.get(Limiter)
-    return SelectedFunction(dU1, dU2)
+    return int(LimFuncCode), int(TVDLimiter[Limiter])
 
 #**************************************************************************
-def LimiterforRSU(r, Limiter):
-    ''' A dictionary to call a function based on the required limiter for
-    the Roe-Sweby Upwind TVD scheme.
+def LimiterforHYU(dU1, dU2, Limiter):
+    ''' Call a function based on the required limiter for the Modified
+    Harten-Yee Upwind TVD scheme.
     '''
-    lim = {
-        "G1" : LimiterG1forRSU,
-        "G2" : LimiterG2forRSU,
-        "G3" : LimiterG3forRSU
-        }
+    return LimiterforHYUCode(dU1, dU2, int(TVDLimiter[Limiter]))
 
-    SelectedFunction = lim.get(Limiter)
-    return SelectedFunction(r)
+#**************************************************************************
+def LimiterforRSU(r, Limiter):
+    ''' Call a function based on the required limiter for the Roe-Sweby
+    Upwind TVD scheme.
+    '''
+    return LimiterforRSUCode(r, int(TVDLimiter[Limiter]))
 
 #**************************************************************************
 def LimiterforDYS(dU1, dU2, dU3, Limiter):
-    ''' A dictionary to call a function based on the required limiter for
-    the Davis-Yee Symmetric TVD scheme.
+    ''' Call a function based on the required limiter for the Davis-Yee
+    Symmetric TVD scheme.
     '''
-    lim = {
-        "G1" : LimiterG1forDYS,
-        "G2" : LimiterG2forDYS,
-        "G3" : LimiterG3forDYS
-        }
+    return LimiterforDYSCode(dU1, dU2, dU3, int(TVDLimiter[Limiter]))
 
-    SelectedFunction = lim.get(Limiter)
-    return SelectedFunction(dU1, dU2, dU3)
+#**************************************************************************
+@njit(cache=True)
+def LimiterforHYUCode(dU1, dU2, LimiterCode):
+    ''' LimiterforHYU() for the limiter given by its TVDLimiter code.'''
+    if LimiterCode == TVDLimiter.G1:
+        return LimiterG1forHYU(dU1, dU2)
+    elif LimiterCode == TVDLimiter.G2:
+        return LimiterG2forHYU(dU1, dU2)
+    elif LimiterCode == TVDLimiter.G3:
+        return LimiterG3forHYU(dU1, dU2)
+    elif LimiterCode == TVDLimiter.G4:
+        return LimiterG4forHYU(dU1, dU2)
+    return LimiterG5forHYU(dU1, dU2)
+
+#**************************************************************************
+def LimiterforHYUArray(dU1, dU2, Limiter, xp):
+    '''Array form of LimiterforHYU() for the arrays of the array module
+    xp, Equations 6-132 to 6-136.
+    '''
+    if Limiter == "G1":
+        S = xp.sign(dU2)
+        return _MinMod(S, xp.abs(dU2), S*dU1, xp)
+    elif Limiter == "G2":
+        return sf.DivideArray(dU1*dU2 + xp.abs(dU1*dU2), dU1 + dU2, xp)
+    elif Limiter == "G3":
+        omeg = 1.e-7 # use between 1.e-7 and 1.e-5
+        return (dU2*(dU1*dU1 + omeg) + dU1*(dU2*dU2 + omeg))\
+               / (dU1*dU1 + dU2*dU2 + 2.0*omeg)
+    elif Limiter == "G4":
+        S = xp.sign(dU2)
+        return _MinMod(S, xp.abs(2.0*dU2),\
+                       xp.minimum(S*2.0*dU1, S*0.5*(dU1 + dU2)), xp)
+    else:
+        S = xp.sign(dU1)
+        return S*xp.maximum(xp.maximum(0.0, xp.minimum(2.0*xp.abs(dU1),\
+                                                       S*dU2)),\
+                            xp.minimum(xp.abs(dU1), 2.0*S*dU2))
+
+#**************************************************************************
+@njit(cache=True)
+def LimiterforRSUCode(r, LimiterCode):
+    ''' LimiterforRSU() for the limiter given by its TVDLimiter code.'''
+    if LimiterCode == TVDLimiter.G1:
+        return LimiterG1forRSU(r)
+    elif LimiterCode == TVDLimiter.G2:
+        return LimiterG2forRSU(r)
+    return LimiterG3forRSU(r)
+
+#**************************************************************************
+def LimiterforRSUArray(r, Limiter, xp):
+    '''Array form of LimiterforRSU() for the arrays of the array module
+    xp, Equations 6-138 to 6-140.
+    '''
+    if Limiter == "G1":
+        return xp.maximum(0.0, xp.minimum(1.0, r))
+    elif Limiter == "G2":
+        return sf.DivideArray(2.0*r, 1.0 + r, xp, r > 0)
+    else:
+        return xp.maximum(xp.maximum(0.0, xp.minimum(2.0*r, 1.0)),\
+                          xp.minimum(r, 2.0))
+
+#**************************************************************************
+@njit(cache=True)
+def LimiterforDYSCode(dU1, dU2, dU3, LimiterCode):
+    ''' LimiterforDYS() for the limiter given by its TVDLimiter code.'''
+    if LimiterCode == TVDLimiter.G1:
+        return LimiterG1forDYS(dU1, dU2, dU3)
+    elif LimiterCode == TVDLimiter.G2:
+        return LimiterG2forDYS(dU1, dU2, dU3)
+    return LimiterG3forDYS(dU1, dU2, dU3)
+
+#**************************************************************************
+def LimiterforDYSArray(dU1, dU2, dU3, Limiter, xp):
+    '''Array form of LimiterforDYS() for the arrays of the array module
+    xp, Equations 6-142 to 6-144.
+    '''
+    S = xp.sign(dU1)
+    if Limiter == "G1":
+        return _MinMod(S, xp.abs(2.0*dU1),\
+                       xp.minimum(xp.minimum(S*2.0*dU2, S*2.0*dU3),\
+                                  S*0.5*(dU1 + dU3)), xp)
+    elif Limiter == "G2":
+        return _MinMod(S, xp.abs(dU1), xp.minimum(S*dU2, S*dU3), xp)
+    else:
+        return _MinMod(S, xp.abs(dU1), S*dU2, xp)\
+               + _MinMod(S, xp.abs(dU1), S*dU3, xp) - S*dU2
+
+#**************************************************************************
+def _MinMod(S, a, b, xp):
+    '''S*max(0, min(a, b)), the common form of the TVD limiters.'''
+    return S*xp.maximum(0.0, xp.minimum(a, b))
 
 #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 #                   LIMITER FUNCTIONS FOR TVD                +
@@ -58,13 +182,12 @@ def LimiterforDYS(dU1, dU2, dU3, Limiter):
 # 4. LIMITERS FOR DAVIS-YEE SYMMETRIC
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterGforHYU(alpha1, alpha2, dU1, dU2, Courant, Ep):
     '''Returns the Harten-Yee Upwind TVD limiter in Equation
        6-130 in CFD Vol. 1 by Hoffmann for the flux limiter
        function given by Equation 6-126.
     '''
-    import nanpack.secondaryfunctions as sf
-    
     # Calculate si(alpha) in sigma and S
     siAlpha1 = sf.EntropyCorrectionFunction(alpha1, Ep)
     siAlpha2 = sf.EntropyCorrectionFunction(alpha2, Ep)
@@ -72,41 +195,55 @@ def LimiterGforHYU(alpha1, alpha2, dU1, dU2, Courant, Ep):
     sigma1 = 0.5*(siAlpha1 - Courant*alpha1*alpha1)
     sigma2 = 0.5*(siAlpha2 - Courant*alpha2*alpha2)
     if dU1 != 0:
-        S = dU1/abs(dU1)
+        S = dU1/fabs(dU1)
     else:
         S = 0.0
     # Equation 6-130
-    term1 = sigma1*abs(dU1)
+    term1 = sigma1*fabs(dU1)
     term2 = S*sigma2*dU2
     G = S*max(0.0, min(term1, term2))  
     
     return G
 
 #**************************************************************************
+def LimiterGforHYUArray(alpha1, alpha2, dU1, dU2, Courant, Ep, xp):
+    '''Array form of LimiterGforHYU() for the arrays of the array module
+    xp.
+    '''
+    sigma1 = 0.5*(sf.EntropyCorrectionArray(alpha1, Ep, xp)\
+                  - Courant*alpha1*alpha1)
+    sigma2 = 0.5*(sf.EntropyCorrectionArray(alpha2, Ep, xp)\
+                  - Courant*alpha2*alpha2)
+    S = xp.sign(dU1)
+    return _MinMod(S, sigma1*xp.abs(dU1), S*sigma2*dU2, xp)
+
+#**************************************************************************
+@njit(cache=True)
 def LimiterG1forHYU(dU1, dU2):
     '''Calculate the Harten-Yee Upwind TVD limiter in Equation
        6-132 in Hoffmann Vol. 1 for the modified flux limiter
        function given by Equation 6-131.
     '''
     if dU2 != 0:
-        S = dU2/abs(dU2)
+        S = dU2/fabs(dU2)
     else:
         S = 0.0
     # Equation 6-132
-    term1 = abs(dU2)
+    term1 = fabs(dU2)
     term2 = S*dU1
     G = S*max(0.0, min(term1, term2))  
     
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG2forHYU(dU1, dU2):
     '''Calculate the Harten-Yee Upwind TVD limiter in Equation
        6-133 in Hoffmann Vol. 1 for the modified flux limiter
        function given by Equation 6-131.
     '''
     term1 = dU1*dU2
-    term2 = abs(term1)
+    term2 = fabs(term1)
     denom = dU1 + dU2
 
     if denom != 0:
@@ -118,6 +255,7 @@ def LimiterG2forHYU(dU1, dU2):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG3forHYU(dU1, dU2):
     '''Calculate the Harten-Yee Upwind TVD limiter in Equation
        6-134 in Hoffmann Vol. 1 for the modified flux limiter
@@ -134,17 +272,18 @@ def LimiterG3forHYU(dU1, dU2):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG4forHYU(dU1, dU2):
     '''Calculate the Harten-Yee Upwind TVD limiter in Equation
        6-135 in Hoffmann Vol. 1 for the modified flux limiter
        function given by Equation 6-131.
     '''
     if dU2 != 0:
-        S = dU2/abs(dU2)
+        S = dU2/fabs(dU2)
     else:
         S = 0.0
 
-    term1 = abs(2.0*dU2)
+    term1 = fabs(2.0*dU2)
     term2 = S*2.0*dU1
     term3 = S*0.5*(dU1 + dU2)
 
@@ -154,19 +293,20 @@ def LimiterG4forHYU(dU1, dU2):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG5forHYU(dU1,dU2):
     '''Calculate the Harten-Yee Upwind TVD limiter in Equation
        6-136 in Hoffmann Vol. 1 for the modified flux limiter
        function given by Equation 6-131.
     '''
     if dU1 != 0:
-        S = dU1/abs(dU1)
+        S = dU1/fabs(dU1)
     else:
         S = 0.0
     
-    term1 = 2.0*abs(dU1)
+    term1 = 2.0*fabs(dU1)
     term2 = S*dU2
-    term3 = abs(dU1)
+    term3 = fabs(dU1)
     term4 = 2.0*S*dU2
 
     # Equation 6-136
@@ -175,6 +315,7 @@ def LimiterG5forHYU(dU1,dU2):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG1forRSU(r):
     '''Calculate the Roe-Sweby Upwind TVD limiter in Equation
        6-138 in Hoffmann Vol. 1 for the flux limiter function
@@ -186,17 +327,22 @@ def LimiterG1forRSU(r):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG2forRSU(r):
     '''Calculate the Roe-Sweby Upwind TVD limiter in Equation
        6-139 in Hoffmann Vol. 1 for the flux limiter function
        given by Equation 6-137.
     '''
-    # Equation 6-139
-    G = (r + abs(r))/(1.0 + r)
+    # Equation 6-139, (r + |r|)/(1 + r) is zero for r <= 0
+    if r > 0:
+        G = 2.0*r/(1.0 + r)
+    else:
+        G = 0.0
     
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG3forRSU(r):
     '''Calculate the Roe-Sweby Upwind TVD limiter in Equation
        6-140 in Hoffmann Vol. 1 for the flux limiter function
@@ -208,16 +354,17 @@ def LimiterG3forRSU(r):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG1forDYS(dU1, dU2, dU3):
     '''Calculate the Davis-Yee Symmetric TVD limiter in Equation
        6-142 in Hoffmann Vol. 1 for the flux limiter function
        given by Equation 6-141.
     '''
     if 2.0*dU1 != 0:
-        S = 2.0*dU1/abs(2.0*dU1)
+        S = 2.0*dU1/fabs(2.0*dU1)
     else:
         S = 0.0
-    term1 = abs(2.0*dU1)
+    term1 = fabs(2.0*dU1)
     term2 = S*2.0*dU2
     term3 = S*2.0*dU3
     term4 = S*0.5*(dU1 + dU3)
@@ -227,16 +374,17 @@ def LimiterG1forDYS(dU1, dU2, dU3):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG2forDYS(dU1, dU2, dU3):
     '''Calculate the Davis-Yee Symmetric TVD limiter in Equation
        6-143 in Hoffmann Vol. 1 for the flux limiter function
        given by Equation 6-141.
     '''
     if dU1 != 0:
-        S = dU1/abs(dU1)
+        S = dU1/fabs(dU1)
     else:
         S = 0.0
-    term1 = abs(dU1)
+    term1 = fabs(dU1)
     term2 = S*dU2
     term3 = S*dU3
     # Equation 6-143
@@ -245,18 +393,19 @@ def LimiterG2forDYS(dU1, dU2, dU3):
     return G
 
 #**************************************************************************
+@njit(cache=True)
 def LimiterG3forDYS(dU1, dU2, dU3):
     '''Calculate the Davis-Yee Symmetric TVD limiter in Equation
        6-144 in Hoffmann Vol. 1 for the flux limiter function
        given by Equation 6-141.
     '''
     if dU1 != 0:
-        S = dU1/abs(dU1)
+        S = dU1/fabs(dU1)
     else:
         S = 0.0
-    term11 = abs(dU1) # term 1 in 1st minmod
+    term11 = fabs(dU1) # term 1 in 1st minmod
     term12 = S*dU2 # term 2 in 1st minmod
-    term21 = abs(dU1) # term 1 in 2nd minmod
+    term21 = fabs(dU1) # term 1 in 2nd minmod
     term22 = S*dU3 # term 2 in 2nd minmod
     term3 = S*dU2
     # Equation 6-144
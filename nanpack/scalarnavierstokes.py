@@ -91,7 +91,6 @@ def ExplicitFirstUpwind(cfg, Uo, Courant):
         The dependent variable calculated at time level (n+1) within the
         entire domain.
     '''
-    import numpy as np
     shapeU = Uo.shape # Obtain Dimension
     if len(shapeU) == 2:
         raise Exception("This formulation is only available for 1D first\
@@ -99,8 +98,8 @@ def ExplicitFirstUpwind(cfg, Uo, Courant):
 
     U = Uo.copy() # Initialize U
     if cfg.Model.upper() == 'FO_WAVE':
-        positive_a = 1 + np.sign(cfg.conv) # for positive a
-        negative_a = 1 - np.sign(cfg.conv) # for negative a
+        positive_a = 1 + cfg._sign_conv # for positive a
+        negative_a = 1 - cfg._sign_conv # for negative a
         U[1:-1] = Uo[1:-1]\
                   - 0.5*Courant*positive_a*(Uo[1:-1] - Uo[0:-2])\
                   - 0.5*Courant*negative_a*(Uo[2:] - Uo[1:-1])
@@ -40,7 +40,15 @@
 +**************************************************************************
 +**************************************************************************
 '''
+from math import fabs
+from numba import njit
+
+# The scalar functions are compiled with Numba so that the compiled TVD
+# kernels of the solvers call them as well as the Python code. Their
+# *Array forms take the array module xp, numpy or cupy.
+
 #**************************************************************************
+@njit(cache=True)
 def EntropyCorrectionFunction(Alpha, Eps):
     '''Returns the value of entropy correction term (Equation 6-127 or
     Equation 6-121) defined in CFD Vol. 1 by Hoffmann.
@@ -71,7 +79,7 @@ def EntropyCorrectionFunction(Alpha, Eps):
          Entropy correction term.    
 
     '''
-    AlphaAbs = abs(Alpha)
+    AlphaAbs = fabs(Alpha)
     if AlphaAbs >= Eps:
         si = AlphaAbs
     else:
@@ -80,11 +88,35 @@ def EntropyCorrectionFunction(Alpha, Eps):
     return si
 
 #**************************************************************************
+def EntropyCorrectionArray(Alpha, Eps, xp):
+    '''Array form of EntropyCorrectionFunction() for the arrays of the
+    array module xp, numpy or cupy.
+    '''
+    AlphaAbs = xp.abs(Alpha)
+    return xp.where(AlphaAbs >= Eps, AlphaAbs,\
+                    (Alpha*Alpha + Eps*Eps)/(2*Eps))
+
+#**************************************************************************
+@njit(cache=True)
 def CalcAlpha(E1, E2, dU, U1, U2):
     '''Returns the results of Equation 6-128 in CFD Vol.1 by Hoffmann.'''
     return ((E1 - E2)/dU if dU != 0 else 0.5*(U1 + U2))
 
 #**************************************************************************
+def CalcAlphaArray(E1, E2, dU, U1, U2, xp):
+    '''Array form of CalcAlpha(), Equation 6-128.'''
+    return xp.where(dU != 0, DivideArray(E1 - E2, dU, xp), 0.5*(U1 + U2))
+
+#**************************************************************************
+@njit(cache=True)
+def CalcAlphaBurgers(U1, U2):
+    '''Returns the results of Equation 6-128 in CFD Vol.1 by Hoffmann for
+    E = 0.5U**2, which reduces to 0.5*(U1 + U2) also where dU = 0.
+    '''
+    return 0.5*(U1 + U2)
+
+#**************************************************************************
+@njit(cache=True)
 def CalcUi(U2, U1):
     '''Returns the backward differencing result of the dependent
     variable.
@@ -92,8 +124,18 @@ def CalcUi(U2, U1):
     return (U2 - U1)
 
 #**************************************************************************
+@njit(cache=True)
 def CalcE(U):
     '''Returns the result of the non-linear variable E = 0.5U**2.'''
     return (0.5*U*U)
 
 #**************************************************************************
+def DivideArray(num, denom, xp, mask=None):
+    '''Returns num/denom where mask holds, denom != 0 by default, and zero
+    elsewhere, for the arrays of the array module xp.
+    '''
+    if mask is None:
+        mask = denom != 0
+    return xp.where(mask, num/xp.where(mask, denom, 1.0), 0.0)
+
+#**************************************************************************
@@ -74,6 +74,8 @@ class RunConfig:
         import nanpack.backend.checkconfig as chk
 
         self.File = InFileName
+        # Work arrays reused by the solvers across time steps.
+        self._scratch = {}
 
         print('*******************************************************')
         print('*                                                     *')
@@ -104,7 +106,40 @@ class RunConfig:
         self.ConfigSimStop()
         self.ConfigOutput()
         self.DisplayConfig()
-        
+
+#**************************** PROPERTY MODEL ******************************
+    @property
+    def Model(self):
+        '''Model equation specified in the SETUP section of configuration
+        file.
+        '''
+        return self._Model
+
+    @Model.setter
+    def Model(self, Model):
+        '''Set the model equation and cache its upper-case name which is
+        used by the solvers to select their formulation.
+        '''
+        self._Model = Model
+        self._model_key = Model.upper()
+
+#**************************** PROPERTY CONV *******************************
+    @property
+    def conv(self):
+        '''Convection constant specified in the CONST section of
+        configuration file.
+        '''
+        return self._conv
+
+    @conv.setter
+    def conv(self, conv):
+        '''Set the convection constant and cache its sign, which is
+        used by the upwind solvers to select the differencing direction.
+        '''
+        import math
+        self._conv = conv
+        self._sign_conv = math.copysign(1.0, conv) if conv != 0 else 0.0
+
 #************************ FUNCTION SOLVERSETUP ****************************
     def ConfigSolverSetUp(self):
         '''Access numerical setup inputs that are specified in the
@@ -114,6 +149,7 @@ class RunConfig:
 
             RunConfig.SolverSetUp()
         '''
+        import numpy as np
         import nanpack.backend.checkconfig as chk
         #************ SET-UP ***************
         print('Checking numerical setup.')
@@ -124,8 +160,33 @@ class RunConfig:
         self.Model = self.config['SETUP']['MODEL']
         self.Scheme = self.config['SETUP']['SCHEME']
         self.Dimension = self.config['SETUP']['DIMENSION']
+        # Floating point precision of the solution arrays. SINGLE halves
+        # the memory traffic of the solvers at the cost of round-off.
+        self.Precision = self.config['SETUP'].get('PRECISION', 'DOUBLE')
+        # Device on which the solvers which support it are run. GPU
+        # runs them with CuPy, which pays off for large grids only.
+        self.Device = self.config['SETUP'].get('DEVICE', 'CPU')
         chk.CheckSetupSection(self.config,self.State,self.Model,\
                               self.Dimension,self.File)
+        if self.Precision.upper() == 'SINGLE':
+            self.dtype = np.float32
+        elif self.Precision.upper() == 'DOUBLE':
+            self.dtype = np.float64
+        else:
+            raise Exception(f'ERROR: Precision "{self.Precision}" not\
+ available. Available options are: SINGLE, DOUBLE.')
+        if self.Device.upper() == 'CPU':
+            self.xp = np
+        elif self.Device.upper() == 'GPU':
+            try:
+                import cupy
+            except ImportError:
+                raise Exception('ERROR: Device "GPU" requires the CuPy\
+ package.') from None
+            self.xp = cupy
+        else:
+            raise Exception(f'ERROR: Device "{self.Device}" not\
+ available. Available options are: CPU, GPU.')
 #************************* FUNCTION GRIDGEN *******************************
     def ConfigGrid(self):
         '''Access meshing inputs that are specified in the
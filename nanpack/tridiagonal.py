@@ -40,6 +40,9 @@
 +**************************************************************************
 +**************************************************************************
 '''
+import numpy as np
+from scipy.linalg import get_lapack_funcs
+
 #**************************************************************************
 def TridiagonalSolver(tMax, A, B, C, D, UU):
     '''Solve a tridiagonal matrix for a system of linear equations
@@ -106,3 +109,71 @@ def TridiagonalSolver(tMax, A, B, C, D, UU):
 
     return UU
 
+#**************************************************************************
+def LapackTridiagonalSolver(tMax, A, B, C, D, UU):
+    '''Solve the same tridiagonal system as TridiagonalSolver() using
+    the tridiagonal solver gtsv of LAPACK through scipy.linalg.
+
+    The values of UU at the first and the last point are the boundary
+    conditions. They are moved to the right hand side and the system is
+    solved for the interior points only.
+
+    Call signature:
+
+        LapackTridiagonalSolver(tMax, A, B, C, D, UU)
+
+    Parameters
+    ----------
+
+    tMax : int
+
+           Grid points in a given axis direction.
+
+    A : 1D array
+
+        Coefficient of u(i-1, n+1) in the implicit formulation.
+
+    B : 1D array
+
+        Coefficient of u(i, n+1) in the implicit formulation.
+
+    C : 1D array
+
+        Coefficient of u(i+1, n+1) in the implicit formulation.
+
+    D : 1D array
+
+        Right hand side equations in the implicit formulation.
+
+    UU : 1D array
+
+         The dependent variable at time level (n) within the domain
+         along a given axis as required by the implicit method.
+
+    Returns
+    -------
+
+    UU : 1D array
+
+        The dependent variable within the domain, the interior points
+        are overwritten with the solution.
+    '''
+    if tMax < 3:
+        return UU
+    gtsv, = get_lapack_funcs(('gtsv',), (UU,))
+    DL = np.array(A[2:tMax-1], UU.dtype) # sub-diagonal
+    DD = np.array(B[1:tMax-1], UU.dtype) # main diagonal
+    DU = np.array(C[1:tMax-2], UU.dtype) # super-diagonal
+    RHS = np.array(D[1:tMax-1], UU.dtype)
+    RHS[0] -= A[1]*UU[0]
+    RHS[-1] -= C[tMax-2]*UU[tMax-1]
+    if tMax == 3: # single interior point, gtsv needs two
+        UU[1] = RHS[0]/DD[0]
+        return UU
+    X, info = gtsv(DL, DD, DU, RHS, overwrite_dl=1, overwrite_d=1,
+                   overwrite_du=1, overwrite_b=1)[3:]
+    if info != 0:
+        raise Exception("The tridiagonal matrix is singular.")
+    UU[1:tMax-1] = X
+
+    return UU
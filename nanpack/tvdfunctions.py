@@ -40,6 +40,16 @@
 +**************************************************************************
 +**************************************************************************
 '''
+from math import fabs
+from numba import njit
+import numpy as np
+import nanpack.limiters as lim
+import nanpack.secondaryfunctions as sf
+
+# The flux limiter functions phi are compiled with Numba, the compiled
+# TVD kernels of the solvers call them with the limiter function and the
+# limiter given by their TVDLimiterFunc and TVDLimiter codes.
+
 #**************************************************************************
 def CalculateTVD(i, Uo, E, Eps, Courant, Limiter, LimFunction):
     ''' A dictionary to call a function based on the required TVD scheme
@@ -55,6 +65,52 @@ def CalculateTVD(i, Uo, E, Eps, Courant, Limiter, LimFunction):
     SelectedFunction = tvd.get(LimFunction)
     return SelectedFunction(i,Uo,E,Eps,Courant,Limiter)
 
+#**************************************************************************
+@njit(cache=True)
+def CalculateTVDPhi(dUiMinus32, dUiMinus12, dUiPlus12, dUiPlus32,
+                    alphaiMinus32, alphaiMinus12, alphaiPlus12,
+                    alphaiPlus32, Eps, Courant, LimiterCode, LimFuncCode):
+    '''CalculateTVD() from the differences of U, dU, and the
+    characteristic speeds, alpha, at the faces (i-3/2) to (i+3/2), for
+    the limiter function and the limiter given by their TVDLimiterFunc
+    and TVDLimiter codes.
+    '''
+    Differences = (dUiMinus32, dUiMinus12, dUiPlus12, dUiPlus32,\
+                   alphaiMinus32, alphaiMinus12, alphaiPlus12,\
+                   alphaiPlus32)
+    if LimFuncCode == lim.TVDLimiterFunc.HARTEN_YEE_UPWIND:
+        return HartenYeeUpwindPhi(*Differences, Eps, Courant,\
+                                  LimiterCode)
+    elif LimFuncCode == lim.TVDLimiterFunc.MODIFIED_HARTEN_YEE_UPWIND:
+        return ModifiedHartenYeeUpwindPhi(*Differences, Eps, Courant,\
+                                          LimiterCode)
+    elif LimFuncCode == lim.TVDLimiterFunc.ROE_SWEBY_UPWIND:
+        return RoeSwebyUpwindPhi(*Differences, Eps, Courant, LimiterCode)
+    return DavisYeeSymmetricPhi(*Differences, Eps, Courant, LimiterCode)
+
+#**************************************************************************
+@njit(cache=True)
+def _TVDDifferences(i, Uo, E):
+    '''Returns the differences of U and the characteristic speeds alpha,
+    Equation 6-128, at the faces (i-3/2) to (i+3/2).
+    '''
+    dUiMinus32 = sf.CalcUi(Uo[i-1], Uo[i-2])
+    dUiMinus12 = sf.CalcUi(Uo[i], Uo[i-1])
+    dUiPlus12 = sf.CalcUi(Uo[i+1], Uo[i])
+    dUiPlus32 = sf.CalcUi(Uo[i+2], Uo[i+1])
+
+    alphaiMinus32 = sf.CalcAlpha(E[i-1], E[i-2], dUiMinus32,\
+                                 Uo[i-1], Uo[i-2])
+    alphaiMinus12 = sf.CalcAlpha(E[i], E[i-1], dUiMinus12,\
+                                 Uo[i], Uo[i-1])
+    alphaiPlus12 = sf.CalcAlpha(E[i+1], E[i], dUiPlus12,\
+                                Uo[i+1], Uo[i])
+    alphaiPlus32 = sf.CalcAlpha(E[i+2], E[i+1], dUiPlus32,\
+                                Uo[i+2], Uo[i+1])
+
+    return dUiMinus32, dUiMinus12, dUiPlus12, dUiPlus32,\
+           alphaiMinus32, alphaiMinus12, alphaiPlus12, alphaiPlus32
+
 #**************************************************************************
 def HartenYeeUpwind(i, Uo, E, Eps, Courant, Limiter):
     '''Returns the value of flux limiter function phi at (i+1/2) and (i-1/2)
@@ -104,39 +160,26 @@ def HartenYeeUpwind(i, Uo, E, Eps, Courant, Limiter):
 
                Flux limiter function at i-1/2 location.
     '''
-    import nanpack.secondaryfunctions as sf
-    import nanpack.limiters as tvd
-
-    dUiPlus12 = sf.CalcUi(Uo[i+1], Uo[i])
-    dUiPlus32 = sf.CalcUi(Uo[i+2], Uo[i+1])
-
-    dUiMinus12 = sf.CalcUi(Uo[i], Uo[i-1])
-    dUiMinus32 = sf.CalcUi(Uo[i-1], Uo[i-2])
-
-    alphaiPlus12 = sf.CalcAlpha(E[i+1], E[i], dUiPlus12,\
-                                Uo[i+1], Uo[i])
-    alphaiMinus12 = sf.CalcAlpha(E[i], E[i-1], dUiMinus12,\
-                                 Uo[i], Uo[i-1])
-    # .............................................................
-    # Calculate some variables required in Harten-Yee Upwind.
-    # .............................................................
-    alphaiPlus32 = sf.CalcAlpha(E[i+2], E[i+1], dUiPlus32,\
-                                Uo[i+2], Uo[i+1])
-    alphaiMinus32 = sf.CalcAlpha(E[i-1], E[i-2], dUiMinus32,\
-                                 Uo[i-1], Uo[i-2])
-
-    if not Limiter == 'G':
-        raise Exception('Invalid TVD limiter for Harten-Yee\
- Upwind TVD.\nUse Limiter = "G".')
+    _, LimiterCode = lim.TVDLimiterCodes("Harten-Yee-Upwind", Limiter)
+    Differences = _TVDDifferences(i, Uo, E)
+    return HartenYeeUpwindPhi(*Differences, Eps, Courant, LimiterCode)
 
-    # .............................................................
+#**************************************************************************
+@njit(cache=True)
+def HartenYeeUpwindPhi(dUiMinus32, dUiMinus12, dUiPlus12, dUiPlus32,
+                       alphaiMinus32, alphaiMinus12, alphaiPlus12,
+                       alphaiPlus32, Eps, Courant, LimiterCode):
+    '''HartenYeeUpwind() from the differences of U, dU, and the
+    characteristic speeds, alpha, at the faces (i-3/2) to (i+3/2), for
+    the limiter given by its TVDLimiter code.
+    '''
     # Equation 6-130
-    Gi = tvd.LimiterGforHYU(alphaiPlus12, alphaiMinus12, dUiPlus12,\
+    Gi = lim.LimiterGforHYU(alphaiPlus12, alphaiMinus12, dUiPlus12,\
                             dUiMinus12, Courant, Eps)
-    GiPlus1 = tvd.LimiterGforHYU(alphaiPlus32, alphaiPlus12, dUiPlus32,\
+    GiPlus1 = lim.LimiterGforHYU(alphaiPlus32, alphaiPlus12, dUiPlus32,\
                                  dUiPlus12, Courant, Eps)
-    GiMinus1 = tvd.LimiterGforHYU(alphaiMinus12, alphaiMinus32, dUiMinus12,\
-                                  dUiMinus32, Courant, Eps)
+    GiMinus1 = lim.LimiterGforHYU(alphaiMinus12, alphaiMinus32,\
+                                  dUiMinus12, dUiMinus32, Courant, Eps)
     # Equation 6-129
     if dUiPlus12 != 0:
         betaiPlus12 = (GiPlus1 - Gi)/dUiPlus12
@@ -210,38 +253,25 @@ def ModifiedHartenYeeUpwind(i, Uo, E, Eps, Courant, Limiter):
 
                Flux limiter function at i-1/2 location.
     '''
-    import nanpack.secondaryfunctions as sf
-    import nanpack.limiters as tvd
+    _, LimiterCode = lim.TVDLimiterCodes("Modified-Harten-Yee-Upwind",\
+                                         Limiter)
+    Differences = _TVDDifferences(i, Uo, E)
+    return ModifiedHartenYeeUpwindPhi(*Differences, Eps, Courant,\
+                                      LimiterCode)
 
-    dUiPlus12 = sf.CalcUi(Uo[i+1], Uo[i])
-    dUiPlus32 = sf.CalcUi(Uo[i+2], Uo[i+1])
-
-    dUiMinus12 = sf.CalcUi(Uo[i], Uo[i-1])
-    dUiMinus32 = sf.CalcUi(Uo[i-1], Uo[i-2])
-
-    # Equation 6-128
-    alphaiPlus12 = sf.CalcAlpha(E[i+1], E[i], dUiPlus12,\
-                                Uo[i+1], Uo[i])
-    alphaiMinus12 = sf.CalcAlpha(E[i], E[i-1], dUiMinus12,\
-                                 Uo[i], Uo[i-1])
-
-    # .................................................................
-    # Calculate some variables required in Modified Harten-Yee Upwind.
-    # .................................................................
-    alphaiPlus32 = sf.CalcAlpha(E[i+2], E[i+1], dUiPlus32,\
-                                Uo[i+2], Uo[i+1])
-    alphaiMinus32 = sf.CalcAlpha(E[i-1], E[i-2], dUiMinus32,\
-                                 Uo[i-1], Uo[i-2])
-
-    # .............................................................
-    if not Limiter in ["G1", "G2", "G3", "G4", "G5"]:
-        raise Exception('Invalid TVD limiter for the Modified Harten\
--Yee Upwind TVD.\nValid options are "G1"/"G2"/"G3"/"G4"/"G5".')
-
-    # .............................................................
-    Gi = tvd.LimiterforHYU(dUiPlus12, dUiMinus12, Limiter)
-    GiPlus1 = tvd.LimiterforHYU(dUiPlus32, dUiPlus12, Limiter)
-    GiMinus1 = tvd.LimiterforHYU(dUiMinus12, dUiMinus32, Limiter)
+#**************************************************************************
+@njit(cache=True)
+def ModifiedHartenYeeUpwindPhi(dUiMinus32, dUiMinus12, dUiPlus12,
+                               dUiPlus32, alphaiMinus32, alphaiMinus12,
+                               alphaiPlus12, alphaiPlus32, Eps, Courant,
+                               LimiterCode):
+    '''ModifiedHartenYeeUpwind() from the differences of U, dU, and the
+    characteristic speeds, alpha, at the faces (i-3/2) to (i+3/2), for
+    the limiter given by its TVDLimiter code.
+    '''
+    Gi = lim.LimiterforHYUCode(dUiPlus12, dUiMinus12, LimiterCode)
+    GiPlus1 = lim.LimiterforHYUCode(dUiPlus32, dUiPlus12, LimiterCode)
+    GiMinus1 = lim.LimiterforHYUCode(dUiMinus12, dUiMinus32, LimiterCode)
 
     # Calculate si(alpha) and sigma(si(alpha))
     siAlphaP = sf.EntropyCorrectionFunction(alphaiPlus12, Eps)
@@ -323,64 +353,59 @@ def RoeSwebyUpwind(i, Uo, E, Eps, Courant, Limiter):
 
                Flux limiter function at i-1/2 location.
     '''
-    import nanpack.secondaryfunctions as sf
-    import nanpack.limiters as tvd
-
-    dUiPlus12 = sf.CalcUi(Uo[i+1], Uo[i])
+    _, LimiterCode = lim.TVDLimiterCodes("Roe-Sweby-Upwind", Limiter)
+    Differences = _TVDDifferences(i, Uo, E)
+    return RoeSwebyUpwindPhi(*Differences, Eps, Courant, LimiterCode)
 
-    dUiMinus12 = sf.CalcUi(Uo[i], Uo[i-1])
-
-    # Equation 6-128
-    alphaiPlus12 = sf.CalcAlpha(E[i+1], E[i], dUiPlus12,\
-                                Uo[i+1], Uo[i])
-    alphaiMinus12 = sf.CalcAlpha(E[i], E[i-1], dUiMinus12,\
-                                 Uo[i], Uo[i-1])
-
-    # .............................................................
-    # Calculate some variables required in Row-Sweby Upwind.
-    # .............................................................
+#**************************************************************************
+@njit(cache=True)
+def RoeSwebyUpwindPhi(dUiMinus32, dUiMinus12, dUiPlus12, dUiPlus32,
+                      alphaiMinus32, alphaiMinus12, alphaiPlus12,
+                      alphaiPlus32, Eps, Courant, LimiterCode):
+    '''RoeSwebyUpwind() from the differences of U, dU, and the
+    characteristic speeds, alpha, at the faces (i-3/2) to (i+3/2), for
+    the limiter given by its TVDLimiter code.
+    '''
+    # Equation 6-139, r is the ratio of the upwind to the local
+    # difference of U
     zero_filter = 1.e-7 # variable to filter out division by zero
-    if alphaiPlus12 != 0:
-        sigPlus12 = alphaiPlus12/abs(alphaiPlus12)
-    else:
-        sigPlus12 = 0.0
-
-    if alphaiMinus12 != 0:
-        sigMinus12 = alphaiMinus12/abs(alphaiMinus12)
-    else:
-        sigMinus12 = 0.0
-
-    if dUiPlus12 >= zero_filter:
-        riPlus = (Uold[i+1+int(sigPlus12)] -\
-                  Uold[i+int(sigPlus12)])/dUiPlus12
+    if fabs(dUiPlus12) >= zero_filter:
+        riPlus = _UpwindDiff(alphaiPlus12, dUiMinus12, dUiPlus12,\
+                             dUiPlus32)/dUiPlus12
     else:
         riPlus = 0.0
 
-    if dUiMinus12 >= zero_filter:
-        riMinus = (Uold[i+int(sigMinus12)] -\
-                   Uold[i+1+int(sigMinus12)])/dUiMinus12
+    if fabs(dUiMinus12) >= zero_filter:
+        riMinus = _UpwindDiff(alphaiMinus12, dUiMinus32, dUiMinus12,\
+                              dUiPlus12)/dUiMinus12
     else:
         riMinus = 0.0
 
-    # .............................................................
-    if not Limiter in ["G1", "G2", "G3"]:
-        raise Exception('Invalid TVD limiter for the Roe-\
-Sweby Upwind TVD.\nValid options are "G1"/"G2"/"G3".')
-
-    # .............................................................
-    Gi = tvd.LimiterforRSU(riPlus, Limiter)
-    GiMinus1 = tvd.LimiterforRSU(riMinus, Limiter)
+    Gi = lim.LimiterforRSUCode(riPlus, LimiterCode)
+    GiMinus1 = lim.LimiterforRSUCode(riMinus, LimiterCode)
 
     # Calculate the flux limiter function, Equation 6-137
     phiPlus = ((Gi/2.0)*\
-               (abs(alphaiPlus12) + Courant*alphaiPlus12**2)\
-               - abs(alphaiPlus12))*dUiPlus12
+               (fabs(alphaiPlus12) + Courant*alphaiPlus12**2)\
+               - fabs(alphaiPlus12))*dUiPlus12
     phiMinus = ((GiMinus1/2.0)*\
-                (abs(alphaiMinus12) + Courant*alphaiMinus12**2)\
-                - abs(alphaiMinus12))*dUiMinus12
+                (fabs(alphaiMinus12) + Courant*alphaiMinus12**2)\
+                - fabs(alphaiMinus12))*dUiMinus12
 
     return phiPlus, phiMinus
 
+#**************************************************************************
+@njit(cache=True)
+def _UpwindDiff(alpha, dUMinus, dU, dUPlus):
+    '''Difference of U one face upwind of the face of dU, where alpha is
+    the characteristic speed at that face, and dU itself for alpha = 0.
+    '''
+    if alpha > 0:
+        return dUMinus
+    elif alpha < 0:
+        return dUPlus
+    return dU
+
 #**************************************************************************
 def DavisYeeSymmetric(i, Uo, E, Eps, Courant, Limiter):
     '''Returns the value of flux limiter function phi at (i+1/2) and (i-1/2)
@@ -431,28 +456,23 @@ def DavisYeeSymmetric(i, Uo, E, Eps, Courant, Limiter):
 
                Flux limiter function at i-1/2 location.
     '''
-    import nanpack.secondaryfunctions as sf
-    import nanpack.limiters as tvd
-
-    dUiPlus12 = sf.CalcUi(Uo[i+1], Uo[i])
-    dUiPlus32 = sf.CalcUi(Uo[i+2], Uo[i+1])
+    _, LimiterCode = lim.TVDLimiterCodes("Davis-Yee-Symmetric", Limiter)
+    Differences = _TVDDifferences(i, Uo, E)
+    return DavisYeeSymmetricPhi(*Differences, Eps, Courant, LimiterCode)
 
-    dUiMinus12 = sf.CalcUi(Uo[i], Uo[i-1])
-    dUiMinus32 = sf.CalcUi(Uo[i-1], Uo[i-2])
-
-    alphaiPlus12 = sf.CalcAlpha(E[i+1], E[i], dUiPlus12,\
-                                Uo[i+1], Uo[i])
-    alphaiMinus12 = sf.CalcAlpha(E[i], E[i-1], dUiMinus12,\
-                                 Uo[i], Uo[i-1])
-
-    # .............................................................
-    if not Limiter in ["G1", "G2", "G3"]:
-        raise Exception('Invalid TVD limiter for the Davis-\
-Yee Symmetric TVD.\nValid options are "G1"/"G2"/"G3".')
-
-    # .............................................................
-    GiPlus12 = tvd.LimiterforDYS(dUiMinus12, dUiPlus12, dUiPlus32, Limiter)
-    GiMinus12 = tvd.LimiterforDYS(dUiMinus32, dUiMinus12, dUiPlus12, Limiter)
+#**************************************************************************
+@njit(cache=True)
+def DavisYeeSymmetricPhi(dUiMinus32, dUiMinus12, dUiPlus12, dUiPlus32,
+                         alphaiMinus32, alphaiMinus12, alphaiPlus12,
+                         alphaiPlus32, Eps, Courant, LimiterCode):
+    '''DavisYeeSymmetric() from the differences of U, dU, and the
+    characteristic speeds, alpha, at the faces (i-3/2) to (i+3/2), for
+    the limiter given by its TVDLimiter code.
+    '''
+    GiPlus12 = lim.LimiterforDYSCode(dUiMinus12, dUiPlus12, dUiPlus32,\
+                                     LimiterCode)
+    GiMinus12 = lim.LimiterforDYSCode(dUiMinus32, dUiMinus12, dUiPlus12,\
+                                      LimiterCode)
 
     # Calculate function si(alpha) in Equation 6-141
     siPlus = sf.EntropyCorrectionFunction(alphaiPlus12, Eps)
@@ -466,10 +486,158 @@ Yee Symmetric TVD.\nValid options are "G1"/"G2"/"G3".')
     return phiPlus, phiMinus
 
 #**************************************************************************
+def CalculateTVDVectorized(Uo, E, Eps, Courant, Limiter, LimFunction,
+                           xp=np):
+    '''Returns the flux limiter function phi at (i+1/2) and (i-1/2) for
+    all the points i = 2 to iMax-3 at once. This is the whole-array
+    counterpart of CalculateTVD(), the limiter branches are evaluated
+    with masks so that the arithmetic is done on array slices.
 
+    Call signature:
 
+        CalculateTVDVectorized(Uo, E, Eps, Courant, Limiter, LimFunction,
+                               xp)
 
+    Parameters
+    ----------
 
+    Uo : 1D array
 
+         The dependent variable from time level (n) within the domain.
 
+    E : 1D array
 
+        The flux vector for the non-linear term in the inviscid Burgers
+        equation, which is E = U^2/2
+
+    Eps : float
+
+          A positive constant value within the range 0.0 and 0.125.
+
+    Courant : float
+
+              Courant number (entered as user input in file).
+
+    Limiter : str
+
+               The limiter for the TVD function.
+
+    LimFunction : str
+
+                  The TVD limiter function, "Harten-Yee-Upwind",
+                  "Modified-Harten-Yee-Upwind", "Roe-Sweby-Upwind" or
+                  "Davis-Yee-Symmetric".
+
+    xp : module, optional
+
+         The array module of Uo and E, numpy (default) or cupy.
+
+    Returns
+    -------
+
+    phiPlus : 1D array
+
+              Flux limiter function at i+1/2 for i = 2 to iMax-3.
+
+    phiMinus : 1D array
+
+               Flux limiter function at i-1/2 for i = 2 to iMax-3.
+    '''
+    lim.TVDLimiterCodes(LimFunction, Limiter)
+    dUiPlus12 = Uo[3:-1] - Uo[2:-2]
+    dUiPlus32 = Uo[4:] - Uo[3:-1]
+    dUiMinus12 = Uo[2:-2] - Uo[1:-3]
+    dUiMinus32 = Uo[1:-3] - Uo[0:-4]
+    # Equation 6-128
+    alphaiPlus12 = sf.CalcAlphaArray(E[3:-1], E[2:-2], dUiPlus12,\
+                                     Uo[3:-1], Uo[2:-2], xp)
+    alphaiMinus12 = sf.CalcAlphaArray(E[2:-2], E[1:-3], dUiMinus12,\
+                                      Uo[2:-2], Uo[1:-3], xp)
+
+    if LimFunction == "Harten-Yee-Upwind":
+        alphaiPlus32 = sf.CalcAlphaArray(E[4:], E[3:-1], dUiPlus32,\
+                                         Uo[4:], Uo[3:-1], xp)
+        alphaiMinus32 = sf.CalcAlphaArray(E[1:-3], E[0:-4], dUiMinus32,\
+                                          Uo[1:-3], Uo[0:-4], xp)
+        # Equation 6-130
+        Gi = lim.LimiterGforHYUArray(alphaiPlus12, alphaiMinus12,\
+                                     dUiPlus12, dUiMinus12, Courant,\
+                                     Eps, xp)
+        GiPlus1 = lim.LimiterGforHYUArray(alphaiPlus32, alphaiPlus12,\
+                                          dUiPlus32, dUiPlus12, Courant,\
+                                          Eps, xp)
+        GiMinus1 = lim.LimiterGforHYUArray(alphaiMinus12, alphaiMinus32,\
+                                           dUiMinus12, dUiMinus32,\
+                                           Courant, Eps, xp)
+        # Equation 6-129
+        betaiPlus12 = sf.DivideArray(GiPlus1 - Gi, dUiPlus12, xp)
+        betaiMinus12 = sf.DivideArray(Gi - GiMinus1, dUiMinus12, xp)
+        siPlus = sf.EntropyCorrectionArray(alphaiPlus12 + betaiPlus12,\
+                                           Eps, xp)
+        siMinus = sf.EntropyCorrectionArray(alphaiMinus12 + betaiMinus12,\
+                                            Eps, xp)
+        # Equation 6-126
+        phiPlus = (GiPlus1 + Gi) - siPlus*dUiPlus12
+        phiMinus = (Gi + GiMinus1) - siMinus*dUiMinus12
+
+    elif LimFunction == "Modified-Harten-Yee-Upwind":
+        Gi = lim.LimiterforHYUArray(dUiPlus12, dUiMinus12, Limiter, xp)
+        GiPlus1 = lim.LimiterforHYUArray(dUiPlus32, dUiPlus12, Limiter,\
+                                         xp)
+        GiMinus1 = lim.LimiterforHYUArray(dUiMinus12, dUiMinus32,\
+                                          Limiter, xp)
+        sigmaP = 0.5*sf.EntropyCorrectionArray(alphaiPlus12, Eps, xp)\
+                 + Courant*alphaiPlus12*alphaiPlus12
+        sigmaM = 0.5*sf.EntropyCorrectionArray(alphaiMinus12, Eps, xp)\
+                 + Courant*alphaiMinus12*alphaiMinus12
+        betaiPlus12 = sigmaP*sf.DivideArray(GiPlus1 - Gi, dUiPlus12, xp)
+        betaiMinus12 = sigmaM*sf.DivideArray(Gi - GiMinus1, dUiMinus12,\
+                                             xp)
+        siPlus = sf.EntropyCorrectionArray(alphaiPlus12 + betaiPlus12,\
+                                           Eps, xp)
+        siMinus = sf.EntropyCorrectionArray(alphaiMinus12 + betaiMinus12,\
+                                            Eps, xp)
+        # Equation 6-131
+        phiPlus = sigmaP*(GiPlus1 + Gi) - siPlus*dUiPlus12
+        phiMinus = sigmaM*(Gi + GiMinus1) - siMinus*dUiMinus12
+
+    elif LimFunction == "Roe-Sweby-Upwind":
+        # Equation 6-139, r is the ratio of the upwind to the local
+        # difference of U
+        zero_filter = 1.e-7 # variable to filter out division by zero
+        kPlus = xp.sign(alphaiPlus12)
+        kMinus = xp.sign(alphaiMinus12)
+        dUupPlus = xp.where(kPlus > 0, dUiMinus12,\
+                            xp.where(kPlus < 0, dUiPlus32, dUiPlus12))
+        dUupMinus = xp.where(kMinus > 0, dUiMinus32,\
+                             xp.where(kMinus < 0, dUiPlus12, dUiMinus12))
+        riPlus = sf.DivideArray(dUupPlus, dUiPlus12, xp,\
+                                xp.abs(dUiPlus12) >= zero_filter)
+        riMinus = sf.DivideArray(dUupMinus, dUiMinus12, xp,\
+                                 xp.abs(dUiMinus12) >= zero_filter)
+        Gi = lim.LimiterforRSUArray(riPlus, Limiter, xp)
+        GiMinus1 = lim.LimiterforRSUArray(riMinus, Limiter, xp)
+        # Equation 6-137
+        phiPlus = ((Gi/2.0)*(xp.abs(alphaiPlus12)\
+                             + Courant*alphaiPlus12*alphaiPlus12)\
+                   - xp.abs(alphaiPlus12))*dUiPlus12
+        phiMinus = ((GiMinus1/2.0)*(xp.abs(alphaiMinus12)\
+                                    + Courant*alphaiMinus12*alphaiMinus12)\
+                    - xp.abs(alphaiMinus12))*dUiMinus12
+
+    else:
+        GiPlus12 = lim.LimiterforDYSArray(dUiMinus12, dUiPlus12,\
+                                          dUiPlus32, Limiter, xp)
+        GiMinus12 = lim.LimiterforDYSArray(dUiMinus32, dUiMinus12,\
+                                           dUiPlus12, Limiter, xp)
+        siPlus = sf.EntropyCorrectionArray(alphaiPlus12, Eps, xp)
+        siMinus = sf.EntropyCorrectionArray(alphaiMinus12, Eps, xp)
+        # Equation 6-141
+        phiPlus = -((Courant*alphaiPlus12*alphaiPlus12*GiPlus12)\
+                    + (siPlus*(dUiPlus12 - GiPlus12)))
+        phiMinus = -((Courant*alphaiMinus12*alphaiMinus12*GiMinus12)\
+                     + (siMinus*(dUiMinus12 - GiMinus12)))
+
+    return phiPlus, phiMinus
+
+#**************************************************************************
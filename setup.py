@@ -13,6 +13,11 @@ long_description_content_type='text/markdown',
 include_package_data=True,
 package_dir = {'':'nanpack'},
 python_requires='>=3.7',
+install_requires=[
+    'numpy',
+    'numba',
+    'scipy',
+],
 classifiers=[
     'Development Status :: 3 - Alpha',
     'Programming Language :: Python :: 3.7',